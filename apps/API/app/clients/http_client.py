@@ -0,0 +1,50 @@
+"""
+Shared HTTP client for outbound provider calls.
+
+A single httpx.AsyncClient is kept for the lifetime of the process so that
+connection pools (TCP + TLS sessions) are reused across OCR requests instead
+of being rebuilt per call. The client is closed from the FastAPI lifespan.
+"""
+import logging
+from typing import Optional
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger("media_promo_localizer")
+
+# Global singleton instance
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the global shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # HTTP/2 multiplexes concurrent OCR requests over one TLS connection per host
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            # Separate limits so a dead host fails fast while slow responses can still finish
+            timeout=httpx.Timeout(
+                connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+                read=settings.HTTP_READ_TIMEOUT_SECONDS,
+                write=settings.HTTP_WRITE_TIMEOUT_SECONDS,
+                pool=settings.HTTP_POOL_TIMEOUT_SECONDS,
+            ),
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=60.0,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the global shared HTTP client if it was created."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info("HttpClientClosed")
+    _http_client = None
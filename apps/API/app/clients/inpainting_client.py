@@ -5,13 +5,13 @@ Note: Full background inpainting is out of scope for Sprint 3 - Batch 1.
 This is a stub implementation that returns the original image unchanged.
 Future batches will implement actual background removal/inpainting.
 """
-import asyncio
 import logging
 import time
 from typing import List, Optional
 
 from app.clients.interfaces import IInpaintingClient
 from app.models.jobs import DetectedText
+from app.utils.logging import format_correlation, should_sample_telemetry
 
 logger = logging.getLogger("media_promo_localizer")
 
@@ -36,8 +36,12 @@ class StubInpaintingClient(IInpaintingClient):
         """
         Stub implementation: returns original image unchanged.
 
+        The input object is passed straight through (zero-copy) when it is already
+        immutable ``bytes``; mutable buffers are frozen into ``bytes`` once so callers
+        never alias a buffer that could change underneath them.
+
         Args:
-            image_bytes: Original image bytes
+            image_bytes: Original image bytes (bytes-like)
             regions: List of text regions to inpaint (ignored in stub)
             job_id: Optional job ID for logging context
             request_id: Optional request ID for logging context
@@ -45,34 +49,32 @@ class StubInpaintingClient(IInpaintingClient):
         Returns:
             Original image bytes (unchanged)
         """
-        # Log stub service call
-        endpoint_base = "stub://inpainting"
-        outbound_timestamp = time.time()
-        correlation = []
-        if request_id:
-            correlation.append(f"request={request_id}")
-        if job_id:
-            correlation.append(f"job={job_id}")
-        correlation_str = " ".join(correlation) if correlation else ""
-
-        logger.info(
-            f"ServiceCall {correlation_str} service=INPAINTING endpoint={endpoint_base} "
-            f"method=STUB outbound_timestamp={outbound_timestamp:.3f} "
-            f"payloadSizeBytes={len(image_bytes)} regions={len(regions)}"
-        )
+        # Telemetry only; skip timestamps and formatting entirely when INFO is disabled.
+        # The call/response pair is sampled together so logged pairs stay complete.
+        if logger.isEnabledFor(logging.INFO) and should_sample_telemetry():
+            correlation_str = format_correlation(request_id, job_id)
+            payload_size = len(image_bytes)
 
-        # Simulate stub processing time
-        call_start = time.perf_counter()
-        await asyncio.sleep(0.001)  # Minimal delay for stub
-        call_duration_ms = int((time.perf_counter() - call_start) * 1000)
-        response_timestamp = time.time()
+            # Log stub service call
+            logger.info(
+                "ServiceCall %s service=INPAINTING endpoint=stub://inpainting "
+                "method=STUB outbound_timestamp=%.3f payloadSizeBytes=%d regions=%d",
+                correlation_str,
+                time.time(),
+                payload_size,
+                len(regions),
+            )
 
-        # Log stub response
-        logger.info(
-            f"ServiceResponse {correlation_str} service=INPAINTING status=200 "
-            f"response_timestamp={response_timestamp:.3f} durationMs={call_duration_ms} "
-            f"responseSizeBytes={len(image_bytes)} stub=true"
-        )
+            # Log stub response (stub does no work, so there is no call duration to measure)
+            logger.info(
+                "ServiceResponse %s service=INPAINTING status=200 "
+                "response_timestamp=%.3f durationMs=0 responseSizeBytes=%d stub=true",
+                correlation_str,
+                time.time(),
+                payload_size,
+            )
 
         # Return original image - no inpainting performed
-        return image_bytes
+        if isinstance(image_bytes, bytes):
+            return image_bytes
+        return bytes(image_bytes)
@@ -7,6 +7,29 @@ from typing import List, Optional
 from app.models.jobs import DetectedText
 
 
+class OcrError(RuntimeError):
+    """Raised when an OCR provider call fails."""
+
+
+class OcrTimeout(OcrError):
+    """Raised when an OCR provider call times out."""
+
+
+class OcrHttpError(OcrError):
+    """Raised when an OCR provider returns a non-success HTTP status."""
+
+    def __init__(self, message: str, status_code: int):
+        """
+        Initialize OCR HTTP error.
+
+        Args:
+            message: Error message
+            status_code: HTTP status code returned by the provider
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class OcrResult:
     """Result from OCR processing."""
 
@@ -58,18 +81,22 @@ class IOcrClient(ABC):
     """Interface for OCR clients."""
 
     @abstractmethod
-    async def recognize_text(self, image_bytes: bytes) -> OcrResult:
+    async def recognize_text(
+        self, image_bytes: bytes, job_id: Optional[str] = None, request_id: Optional[str] = None
+    ) -> OcrResult:
         """
         Recognize text in an image.
 
         Args:
             image_bytes: Image file bytes (JPG/PNG)
+            job_id: Optional job ID for logging context
+            request_id: Optional request ID for logging context
 
         Returns:
             OcrResult with detected text regions and image dimensions
 
         Raises:
-            Exception: If OCR processing fails
+            OcrError: If OCR processing fails
         """
         pass
 
@@ -79,7 +106,11 @@ class ITranslationClient(ABC):
 
     @abstractmethod
     async def translate_text_regions(
-        self, regions: List[DetectedText], target_locale: str
+        self,
+        regions: List[DetectedText],
+        target_locale: str,
+        job_id: Optional[str] = None,
+        request_id: Optional[str] = None,
     ) -> List[TranslatedRegion]:
         """
         Translate text regions to target locale.
@@ -87,6 +118,8 @@ class ITranslationClient(ABC):
         Args:
             regions: List of detected text regions to translate
             target_locale: Target locale code (BCP-47, e.g., "fr-FR")
+            job_id: Optional job ID for logging context
+            request_id: Optional request ID for logging context
 
         Returns:
             List of TranslatedRegion objects with translated text
@@ -105,6 +138,8 @@ class IInpaintingClient(ABC):
         self,
         image_bytes: bytes,
         regions: List[DetectedText],
+        job_id: Optional[str] = None,
+        request_id: Optional[str] = None,
     ) -> bytes:
         """
         Inpaint (remove) text regions from an image.
@@ -112,6 +147,8 @@ class IInpaintingClient(ABC):
         Args:
             image_bytes: Original image bytes
             regions: List of text regions to inpaint (bounding boxes)
+            job_id: Optional job ID for logging context
+            request_id: Optional request ID for logging context
 
         Returns:
             Inpainted image bytes (same format as input)
@@ -1,40 +1,114 @@
 """
 OCR client implementations.
 """
-import base64
+import asyncio
+import binascii
 import logging
-import math
 import time
-from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from itertools import chain, islice
+from math import atan2, cos, degrees, radians, sin
+from operator import itemgetter
+from typing import Dict, List, MutableMapping, Optional, Tuple
 
 import httpx
-from PIL import Image
+import orjson
 
-from app.clients.interfaces import IOcrClient, OcrResult
+from app.clients.http_client import get_http_client
+from app.clients.interfaces import IOcrClient, OcrError, OcrHttpError, OcrResult, OcrTimeout
 from app.models.jobs import DetectedText
+from app.utils.image_derivatives import get_image_dimensions
+from app.utils.logging import format_correlation
+from app.utils.ocr_cache import ocr_cache_key
 
 logger = logging.getLogger("media_promo_localizer")
 
 # Type alias for word data tuple: (text, x1, y1, x2, y2, height, vertices_norm, angle_deg)
 WordData = Tuple[str, float, float, float, float, float, Optional[List[Tuple[float, float]]], float]
 
+# Maximum number of images Google Cloud Vision accepts in one images:annotate call
+MAX_IMAGES_PER_REQUEST = 16
+
+# Maximum image file size Google Cloud Vision accepts
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+
+# Partial-response field mask: only the parts of each response the parser reads.
+# The server drops everything else (full-page text, confidences, detected languages,
+# symbol properties, block/paragraph boxes), so it is never transferred or parsed.
+RESPONSE_FIELDS = (
+    "responses("
+    "fullTextAnnotation/pages/blocks/paragraphs/words(boundingBox,symbols/text),"
+    "textAnnotations(description,boundingPoly),"
+    "error)"
+)
+
+# JSON around each image's base64 content in an images:annotate request.
+# Use DOCUMENT_TEXT_DETECTION for better hierarchy (pages → blocks → paragraphs → words)
+_IMAGE_REQUEST_PREFIX = b'{"image":{"content":"'
+_IMAGE_REQUEST_SUFFIX = b'"},"features":[{"type":"DOCUMENT_TEXT_DETECTION"}]}'
+
+# Paragraphs whose dominant word angle is within this many degrees of horizontal (and
+# whose word angles span less than twice that) are clustered without rotation
+AXIS_ALIGNED_ANGLE_DEG = 0.5
+
+# Sort key for (x, y) vertices: by y, then x
+_Y_THEN_X = itemgetter(1, 0)
+
+
+def _encode_annotate_request(images: List[bytes]) -> bytes:
+    """
+    Build the serialized images:annotate request body for a batch of images.
+
+    The base64 output is spliced into a fixed JSON template as bytes: the base64
+    alphabet needs no JSON escaping, so the multi-MB payload never becomes a Python
+    str and is never re-scanned by a JSON serializer.
+
+    Args:
+        images: List of image file bytes (JPG/PNG)
+
+    Returns:
+        JSON request body bytes
+    """
+    parts = [b'{"requests":[']
+    for i, image_bytes in enumerate(images):
+        if i:
+            parts.append(b",")
+        parts.append(_IMAGE_REQUEST_PREFIX)
+        parts.append(binascii.b2a_base64(image_bytes, newline=False))
+        parts.append(_IMAGE_REQUEST_SUFFIX)
+    parts.append(b"]}")
+    return b"".join(parts)
+
 
 class CloudOcrClient(IOcrClient):
     """Google Cloud Vision API OCR client."""
 
-    def __init__(self, api_key: str, api_endpoint: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        api_endpoint: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[MutableMapping[bytes, OcrResult]] = None,
+    ):
         """
         Initialize Google Cloud Vision OCR client.
 
         Args:
             api_key: Google Cloud Vision API key
             api_endpoint: Optional custom API endpoint (defaults to Google's)
+            http_client: Optional HTTP client (defaults to the shared process-wide client)
+            cache: Optional mapping of image digest -> OcrResult used to skip repeat calls
         """
         self.api_key = api_key
         self.api_endpoint = api_endpoint or "https://vision.googleapis.com/v1/images:annotate"
+        self._http_client = http_client
+        self._cache = cache
         if not self.api_key:
             raise ValueError("OCR_API_KEY is required for live OCR mode")
+        # Build the request URL and the loggable endpoint (without API key) once
+        self._url = httpx.URL(self.api_endpoint).copy_merge_params(
+            {"key": self.api_key, "fields": RESPONSE_FIELDS}
+        )
+        self._endpoint_base = self.api_endpoint.split("?")[0]
 
     async def recognize_text(
         self, image_bytes: bytes, job_id: Optional[str] = None, request_id: Optional[str] = None
@@ -50,161 +124,282 @@ class CloudOcrClient(IOcrClient):
             OcrResult with detected text regions and image dimensions
 
         Raises:
-            Exception: If OCR processing fails
+            OcrError: If OCR processing fails
+        """
+        results = await self.recognize_text_batch([image_bytes], job_id=job_id, request_id=request_id)
+        return results[0]
+
+    async def recognize_text_batch(
+        self,
+        images: List[bytes],
+        job_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+    ) -> List[OcrResult]:
+        """
+        Recognize text in several images, packing up to 16 images into each API call.
+
+        Args:
+            images: List of image file bytes (JPG/PNG)
+            job_id: Optional job ID for logging context
+
+        Returns:
+            List of OcrResult, one per input image, in input order
+
+        Raises:
+            OcrError: If any image is empty or over the provider size limit, or if
+                OCR processing fails for any batch
+        """
+        # Reject images the API would refuse before paying for encoding and a round trip
+        for image_bytes in images:
+            if not image_bytes:
+                raise OcrError("OCR image is empty")
+            if len(image_bytes) > MAX_IMAGE_BYTES:
+                raise OcrError(
+                    f"OCR image too large: {len(image_bytes)} bytes (limit {MAX_IMAGE_BYTES})"
+                )
+
+        cache = self._cache
+        results: List[Optional[OcrResult]] = [None] * len(images)
+        keys: List[bytes] = []
+        if cache is not None:
+            # Serve repeat images from the cache; only misses go to the API
+            keys = [ocr_cache_key(image_bytes) for image_bytes in images]
+            for i, key in enumerate(keys):
+                try:
+                    results[i] = cache[key]
+                except KeyError:
+                    pass
+        pending = [i for i, result in enumerate(results) if result is None]
+        if len(pending) < len(images):
+            logger.info(
+                "[OCR] CacheHit hits=%d misses=%d", len(images) - len(pending), len(pending)
+            )
+
+        for start in range(0, len(pending), MAX_IMAGES_PER_REQUEST):
+            batch = pending[start : start + MAX_IMAGES_PER_REQUEST]
+            batch_results = await self._annotate_batch(
+                [images[i] for i in batch], job_id, request_id
+            )
+            for i, result in zip(batch, batch_results):
+                results[i] = result
+                if cache is not None:
+                    cache[keys[i]] = result
+        return results  # type: ignore[return-value]
+
+    async def _annotate_batch(
+        self, images: List[bytes], job_id: Optional[str], request_id: Optional[str]
+    ) -> List[OcrResult]:
+        """
+        Send one images:annotate call for up to MAX_IMAGES_PER_REQUEST images.
+
+        Returns:
+            List of OcrResult, one per input image, in input order
         """
-        # Log endpoint (without API key)
-        endpoint_base = self.api_endpoint.split("?")[0] if "?" in self.api_endpoint else self.api_endpoint
         outbound_timestamp = time.time()
-        correlation = []
-        if request_id:
-            correlation.append(f"request={request_id}")
-        if job_id:
-            correlation.append(f"job={job_id}")
-        correlation_str = " ".join(correlation) if correlation else ""
+        correlation_str = format_correlation(request_id, job_id)
 
         logger.info(
-            f"ServiceCall {correlation_str} service=OCR endpoint={endpoint_base} "
-            f"method=POST outbound_timestamp={outbound_timestamp:.3f} "
-            f"payloadSizeBytes={len(image_bytes)}"
+            "ServiceCall %s service=OCR endpoint=%s method=POST outbound_timestamp=%.3f "
+            "payloadSizeBytes=%d images=%d",
+            correlation_str,
+            self._endpoint_base,
+            outbound_timestamp,
+            sum(len(image_bytes) for image_bytes in images),
+            len(images),
         )
 
         try:
-            # Get image dimensions
-            image = Image.open(BytesIO(image_bytes))
-            image_width, image_height = image.size
-
-            # Prepare request for Google Cloud Vision API
-            image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-
-            # Use DOCUMENT_TEXT_DETECTION for better hierarchy (pages → blocks → paragraphs → words)
-            request_body = {
-                "requests": [
-                    {
-                        "image": {"content": image_base64},
-                        "features": [{"type": "DOCUMENT_TEXT_DETECTION"}],
-                    }
-                ]
-            }
+            # Get image dimensions (header read; no full decode for JPEG/PNG)
+            dimensions = [get_image_dimensions(image_bytes) for image_bytes in images]
+
+            # base64 + JSON encoding of multi-MB images is CPU-bound; keep it off the event loop
+            request_content = await asyncio.to_thread(_encode_annotate_request, images)
 
             # Call Google Cloud Vision API
             call_start = time.perf_counter()
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.api_endpoint}?key={self.api_key}",
-                    json=request_body,
-                )
-                call_duration_ms = int((time.perf_counter() - call_start) * 1000)
-                response_timestamp = time.time()
-                status_code = response.status_code
-
-                # Get response size
-                response_size = len(response.content) if hasattr(response, "content") else 0
-
-                # Log response
-                logger.info(
-                    f"ServiceResponse {correlation_str} service=OCR status={status_code} "
-                    f"response_timestamp={response_timestamp:.3f} durationMs={call_duration_ms} "
-                    f"responseSizeBytes={response_size}"
-                )
+            client = self._http_client or get_http_client()
+            # Send pre-serialized bytes so httpx doesn't re-encode the body
+            response = await client.post(
+                self._url,
+                content=request_content,
+                headers={"Content-Type": "application/json"},
+            )
+            call_duration_ms = int((time.perf_counter() - call_start) * 1000)
+            response_timestamp = time.time()
+            status_code = response.status_code
 
-                response.raise_for_status()
-                result = response.json()
-
-            # Parse response using documentTextDetection hierarchy (pages → blocks → paragraphs → words)
-            # Word structure: (text, x1, y1, x2, y2, height, vertices_norm, angle_deg)
-            words: List[WordData] = []
-
-            if "responses" in result and len(result["responses"]) > 0:
-                response = result["responses"][0]
-
-                # Prefer documentTextDetection hierarchy if available
-                if "fullTextAnnotation" in response and "pages" in response["fullTextAnnotation"]:
-                    pages = response["fullTextAnnotation"]["pages"]
-                    for page in pages:
-                        if "blocks" in page:
-                            for block in page["blocks"]:
-                                if "paragraphs" in block:
-                                    for paragraph in block["paragraphs"]:
-                                        if "words" in paragraph:
-                                            for word in paragraph["words"]:
-                                                word_data = self._extract_word_data(
-                                                    word, image_width, image_height
-                                                )
-                                                if word_data:
-                                                    words.append(word_data)
-
-                # Fallback to textAnnotations if documentTextDetection not available
-                if not words and "textAnnotations" in response:
-                    # First annotation is the full text; skip it
-                    for i, annotation in enumerate(response["textAnnotations"]):
-                        if i == 0:
-                            continue  # Skip full text annotation
-
-                        if "boundingPoly" in annotation and "vertices" in annotation["boundingPoly"]:
-                            vertices = annotation["boundingPoly"]["vertices"]
-                            word_data = self._extract_word_from_vertices(
-                                annotation.get("description", "").strip(),
-                                vertices,
-                                image_width,
-                                image_height,
-                            )
-                            if word_data:
-                                words.append(word_data)
-
-            # Group words into lines using rotation-aware clustering
-            text_regions = self._group_words_into_lines_rotation_aware(words)
+            # Get response size
+            response_body = response.content
+            response_size = len(response_body)
 
+            # Log response
             logger.info(
-                f"[OCR] Summary: words={len(words)} reconstructed_lines={len(text_regions)}"
+                "ServiceResponse %s service=OCR status=%d response_timestamp=%.3f "
+                "durationMs=%d responseSizeBytes=%d",
+                correlation_str,
+                status_code,
+                response_timestamp,
+                call_duration_ms,
+                response_size,
             )
 
-            # Log first N line regions
-            for i, region in enumerate(text_regions[:10]):
-                # Extract geometry if available (stored in a custom attribute)
-                geometry_info = ""
-                if hasattr(region, "_geometry"):
-                    geom = region._geometry
-                    angle = geom.get("angle_deg", 0)
-                    center = geom.get("center_norm", {})
-                    center_str = f"{center.get('x', 0):.3f},{center.get('y', 0):.3f}" if center else "N/A"
-                    geometry_info = f" angle_deg={angle:.1f} center_norm={center_str}"
+            response.raise_for_status()
+            result = orjson.loads(response_body)
 
-                text_preview = region.text[:120] + "..." if len(region.text) > 120 else region.text
-                logger.info(
-                    f"[OCR] LineRegion id={i} role={region.role}{geometry_info} "
-                    f"text={text_preview!r}"
-                )
-            return OcrResult(
-                text_regions=text_regions,
-                image_width=image_width,
-                image_height=image_height,
-            )
+            # Responses are returned in request order; a missing entry parses as no text.
+            # Word extraction and line clustering are CPU-bound; keep them off the event loop.
+            responses = result.get("responses") or []
+            return await asyncio.to_thread(self._parse_annotate_responses, responses, dimensions)
 
+        # Expected provider failures are fully described by the structured fields, so they
+        # are logged without a traceback; only unexpected errors capture exc_info.
         except httpx.HTTPStatusError as e:
             status_code = e.response.status_code
             response_timestamp = time.time()
             logger.error(
-                f"ServiceResponse {correlation_str} service=OCR status={status_code} "
-                f"response_timestamp={response_timestamp:.3f} error=HTTPStatusError",
-                exc_info=True,
+                "ServiceResponse %s service=OCR status=%d response_timestamp=%.3f "
+                "error=HTTPStatusError",
+                correlation_str,
+                status_code,
+                response_timestamp,
             )
-            raise Exception(f"OCR service returned error: {status_code}")
-        except httpx.TimeoutException:
+            raise OcrHttpError(
+                f"OCR service returned error: {status_code}", status_code=status_code
+            ) from e
+        except httpx.TimeoutException as e:
             response_timestamp = time.time()
             logger.error(
-                f"ServiceResponse {correlation_str} service=OCR status=504 "
-                f"response_timestamp={response_timestamp:.3f} error=TimeoutException",
-                exc_info=True,
+                "ServiceResponse %s service=OCR status=504 response_timestamp=%.3f "
+                "error=TimeoutException",
+                correlation_str,
+                response_timestamp,
             )
-            raise Exception("OCR service timeout")
+            raise OcrTimeout("OCR service timeout") from e
         except Exception as e:
             response_timestamp = time.time()
             logger.error(
-                f"ServiceResponse {correlation_str} service=OCR status=500 "
-                f"response_timestamp={response_timestamp:.3f} error={type(e).__name__}",
+                "ServiceResponse %s service=OCR status=500 response_timestamp=%.3f error=%s",
+                correlation_str,
+                response_timestamp,
+                type(e).__name__,
                 exc_info=True,
             )
-            raise Exception(f"OCR processing failed: {str(e)}")
+            raise OcrError(f"OCR processing failed: {str(e)}") from e
+
+    def _parse_annotate_responses(
+        self, responses: List[Dict], dimensions: List[Tuple[int, int]]
+    ) -> List[OcrResult]:
+        """
+        Parse the entries of an images:annotate response, one per requested image.
+
+        Args:
+            responses: The "responses" list (may be shorter than the request)
+            dimensions: (width, height) of each requested image, in request order
+
+        Returns:
+            List of OcrResult in request order
+        """
+        return [
+            self._parse_annotate_response(
+                responses[i] if i < len(responses) else {}, image_width, image_height
+            )
+            for i, (image_width, image_height) in enumerate(dimensions)
+        ]
+
+    def _parse_annotate_response(
+        self, response: Dict, image_width: int, image_height: int
+    ) -> OcrResult:
+        """
+        Parse one entry of an images:annotate response into an OcrResult.
+
+        Args:
+            response: Single response object from the "responses" list
+            image_width: Image width in pixels
+            image_height: Image height in pixels
+
+        Returns:
+            OcrResult with detected text regions and image dimensions
+        """
+        # Parse response using documentTextDetection hierarchy (pages → blocks → paragraphs → words)
+        # Word structure: (text, x1, y1, x2, y2, height, vertices_norm, angle_deg)
+        words: List[WordData] = []
+
+        # Prefer documentTextDetection hierarchy if available
+        if "fullTextAnnotation" in response and "pages" in response["fullTextAnnotation"]:
+            pages = response["fullTextAnnotation"]["pages"]
+            # Flatten pages -> blocks -> paragraphs -> words into a single word stream
+            blocks = chain.from_iterable(page.get("blocks", ()) for page in pages)
+            paragraphs = chain.from_iterable(block.get("paragraphs", ()) for block in blocks)
+            extract_word_data = self._extract_word_data
+            append_word = words.append
+            for word in chain.from_iterable(p.get("words", ()) for p in paragraphs):
+                word_data = extract_word_data(word, image_width, image_height)
+                if word_data:
+                    append_word(word_data)
+
+        # Fallback to textAnnotations if documentTextDetection not available
+        if not words and "textAnnotations" in response:
+            extract_word = self._extract_word_from_vertices
+            append_word = words.append
+            # First annotation is the full text; skip it
+            for annotation in islice(response["textAnnotations"], 1, None):
+                # Skip annotations without text before doing any vertex work
+                text = annotation.get("description", "").strip()
+                if not text:
+                    continue
+                poly = annotation.get("boundingPoly")
+                if not poly:
+                    continue
+                vertices = poly.get("normalizedVertices")
+                normalized = bool(vertices)
+                if not normalized:
+                    vertices = poly.get("vertices")
+                    if vertices is None:
+                        continue
+                word_data = extract_word(
+                    text,
+                    vertices,
+                    image_width,
+                    image_height,
+                    normalized,
+                )
+                if word_data:
+                    append_word(word_data)
+
+        # Group words into lines using rotation-aware clustering
+        text_regions = self._group_words_into_lines_rotation_aware(words)
+
+        logger.info(
+            "[OCR] Summary: words=%d reconstructed_lines=%d", len(words), len(text_regions)
+        )
+
+        # Log first N line regions (per-line detail; skipped entirely unless DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, region in enumerate(text_regions[:10]):
+                # Extract geometry if available
+                geometry_info = ""
+                geom = region._geometry
+                if geom:
+                    angle = geom.get("angle_deg", 0)
+                    center = geom.get("center_norm", {})
+                    center_str = (
+                        f"{center.get('x', 0):.3f},{center.get('y', 0):.3f}" if center else "N/A"
+                    )
+                    geometry_info = f" angle_deg={angle:.1f} center_norm={center_str}"
+
+                text_preview = region.text[:120] + "..." if len(region.text) > 120 else region.text
+                logger.debug(
+                    "[OCR] LineRegion id=%d role=%s%s text=%r",
+                    i,
+                    region.role,
+                    geometry_info,
+                    text_preview,
+                )
+        return OcrResult(
+            text_regions=text_regions,
+            image_width=image_width,
+            image_height=image_height,
+        )
 
     def _extract_word_data(
         self, word: Dict, image_width: int, image_height: int
@@ -227,8 +422,13 @@ class CloudOcrClient(IOcrClient):
         if not text:
             return None
 
-        # Extract bounding box vertices
+        # Extract bounding box vertices (prefer pre-normalized vertices when returned)
         bounding_box = word.get("boundingBox", {})
+        normalized_vertices = bounding_box.get("normalizedVertices")
+        if normalized_vertices and len(normalized_vertices) >= 4:
+            return self._extract_word_from_vertices(
+                text, normalized_vertices, image_width, image_height, normalized=True
+            )
         vertices = bounding_box.get("vertices", [])
         if not vertices or len(vertices) < 4:
             return None
@@ -236,47 +436,54 @@ class CloudOcrClient(IOcrClient):
         return self._extract_word_from_vertices(text, vertices, image_width, image_height)
 
     def _extract_word_from_vertices(
-        self, text: str, vertices: List[Dict], image_width: int, image_height: int
+        self,
+        text: str,
+        vertices: List[Dict],
+        image_width: int,
+        image_height: int,
+        normalized: bool = False,
     ) -> Optional[WordData]:
         """
         Extract word data from vertices list.
 
+        Args:
+            text: Word text
+            vertices: Vision API vertices (pixel coordinates unless normalized=True)
+            image_width: Image width in pixels
+            image_height: Image height in pixels
+            normalized: True if vertices are Vision's normalizedVertices (already in [0, 1])
+
         Returns:
             Tuple of (text, x1, y1, x2, y2, height, vertices_norm, angle_deg)
         """
-        # Extract and normalize vertices
-        vertex_list = []
-        for v in vertices:
-            x = v.get("x", 0)
-            y = v.get("y", 0)
-            vertex_list.append((x / image_width, y / image_height))
-
-        if len(vertex_list) < 4:
+        if len(vertices) < 4:
             return None
 
+        if normalized:
+            vertex_list = [(v.get("x", 0.0), v.get("y", 0.0)) for v in vertices]
+        else:
+            # Normalize pixel vertices (scale by reciprocals instead of dividing per vertex)
+            inv_width = 1.0 / image_width
+            inv_height = 1.0 / image_height
+            vertex_list = [
+                (v.get("x", 0) * inv_width, v.get("y", 0) * inv_height) for v in vertices
+            ]
+
         # Normalize vertex order to TL, TR, BR, BL
         vertices_norm = self._normalize_vertex_order(vertex_list)
 
-        # Compute axis-aligned bounding box
-        x_coords = [v[0] for v in vertices_norm]
-        y_coords = [v[1] for v in vertices_norm]
+        # Compute axis-aligned bounding box (clamped to the image)
+        x_coords, y_coords = zip(*vertices_norm)
         x1 = max(0.0, min(1.0, min(x_coords)))
         y1 = max(0.0, min(1.0, min(y_coords)))
         x2 = max(0.0, min(1.0, max(x_coords)))
         y2 = max(0.0, min(1.0, max(y_coords)))
         height = y2 - y1
 
-        # Compute center and angle
-        center_norm = (
-            sum(v[0] for v in vertices_norm) / len(vertices_norm),
-            sum(v[1] for v in vertices_norm) / len(vertices_norm),
-        )
-
         # Compute angle from TL->TR vector
         tl = vertices_norm[0]
         tr = vertices_norm[1]
-        angle_rad = math.atan2(tr[1] - tl[1], tr[0] - tl[0])
-        angle_deg = math.degrees(angle_rad)
+        angle_deg = degrees(atan2(tr[1] - tl[1], tr[0] - tl[0]))
 
         return (text, x1, y1, x2, y2, height, vertices_norm, angle_deg)
 
@@ -294,19 +501,13 @@ class CloudOcrClient(IOcrClient):
             return vertices
 
         # Sort by y, then x
-        sorted_vertices = sorted(vertices, key=lambda v: (v[1], v[0]))
+        v0, v1, v2, v3 = sorted(vertices, key=_Y_THEN_X)
 
-        # Top two (smaller y)
-        top = sorted_vertices[:2]
-        top_sorted = sorted(top, key=lambda v: v[0])  # Left to right
-        tl = top_sorted[0]
-        tr = top_sorted[1] if len(top_sorted) > 1 else top_sorted[0]
+        # Top two (smaller y), left to right
+        tl, tr = (v1, v0) if v1[0] < v0[0] else (v0, v1)
 
-        # Bottom two (larger y)
-        bottom = sorted_vertices[2:]
-        bottom_sorted = sorted(bottom, key=lambda v: v[0], reverse=True)  # Right to left
-        br = bottom_sorted[0] if len(bottom_sorted) > 0 else bottom[0]
-        bl = bottom_sorted[1] if len(bottom_sorted) > 1 else (bottom[0] if len(bottom) > 0 else vertices[2])
+        # Bottom two (larger y), right to left
+        br, bl = (v3, v2) if v3[0] > v2[0] else (v2, v3)
 
         return [tl, tr, br, bl]
 
@@ -327,31 +528,25 @@ class CloudOcrClient(IOcrClient):
 
         # Group words into paragraphs (simple heuristic: words close together)
         paragraphs: List[List[WordData]] = []
-        current_paragraph: List[WordData] = []
 
         # Sort words by y-coordinate
         words_sorted = sorted(words, key=lambda w: (w[2], w[1]))  # Sort by y1, then x1
 
         paragraph_y_threshold = 0.05  # 5% of image height for paragraph grouping
 
-        for word in words_sorted:
-            if not current_paragraph:
+        # Single pass over the sorted words: a gap in y1 larger than the threshold
+        # starts a new paragraph. y1 is non-decreasing, so the gap is never negative.
+        current_paragraph: List[WordData] = [words_sorted[0]]
+        paragraphs.append(current_paragraph)
+        prev_y = words_sorted[0][2]
+        for word in islice(words_sorted, 1, None):
+            word_y = word[2]  # y1 of current word
+            if word_y - prev_y <= paragraph_y_threshold:
                 current_paragraph.append(word)
             else:
-                # Check if word is in same paragraph (vertical proximity)
-                last_word_y = current_paragraph[-1][2]  # y1 of last word
-                word_y = word[2]  # y1 of current word
-
-                if abs(word_y - last_word_y) <= paragraph_y_threshold:
-                    current_paragraph.append(word)
-                else:
-                    # Start new paragraph
-                    if current_paragraph:
-                        paragraphs.append(current_paragraph)
-                    current_paragraph = [word]
-
-        if current_paragraph:
-            paragraphs.append(current_paragraph)
+                current_paragraph = [word]
+                paragraphs.append(current_paragraph)
+            prev_y = word_y
 
         # Process each paragraph
         all_line_regions: List[DetectedText] = []
@@ -364,49 +559,53 @@ class CloudOcrClient(IOcrClient):
             angles = [w[7] for w in para_words if w[7] is not None]
             if not angles:
                 dominant_angle = 0.0
+                angle_range = 0.0
             else:
-                # Remove outliers (angles more than 45 degrees from median)
+                # Remove outliers (angles more than 45 degrees from median).
+                # Filtering the sorted list keeps it sorted, so one sort serves both medians.
                 angles_sorted = sorted(angles)
+                angle_range = angles_sorted[-1] - angles_sorted[0]
                 median_angle = angles_sorted[len(angles_sorted) // 2]
                 filtered_angles = [
-                    a for a in angles
+                    a for a in angles_sorted
                     if abs(a - median_angle) <= 45.0
                 ]
                 if filtered_angles:
-                    dominant_angle = sorted(filtered_angles)[len(filtered_angles) // 2]
+                    dominant_angle = filtered_angles[len(filtered_angles) // 2]
                 else:
                     dominant_angle = median_angle
 
-            # Compute paragraph centroid
-            para_centroid_x = sum((w[1] + w[3]) / 2 for w in para_words) / len(para_words)
-            para_centroid_y = sum((w[2] + w[4]) / 2 for w in para_words) / len(para_words)
-
-            # Rotate word centers around paragraph centroid
-            word_rotated_data: List[Tuple[
-                Tuple[str, float, float, float, float, float, Optional[List[Tuple[float, float]]], float],
-                float, float  # rotated_y, original_center_y
-            ]] = []
-
-            angle_rad = math.radians(-dominant_angle)
-            cos_a = math.cos(angle_rad)
-            sin_a = math.sin(angle_rad)
-
-            for word in para_words:
-                word_center_x = (word[1] + word[3]) / 2
-                word_center_y = (word[2] + word[4]) / 2
-
-                # Translate to origin (paragraph centroid)
-                dx = word_center_x - para_centroid_x
-                dy = word_center_y - para_centroid_y
-
-                # Rotate
-                rotated_x = dx * cos_a - dy * sin_a
-                rotated_y = dx * sin_a + dy * cos_a
-
-                # Translate back
-                rotated_y_abs = rotated_y + para_centroid_y
-
-                word_rotated_data.append((word, rotated_y_abs, word_center_y))
+            if (
+                abs(dominant_angle) < AXIS_ALIGNED_ANGLE_DEG
+                and angle_range < 2 * AXIS_ALIGNED_ANGLE_DEG
+            ):
+                # Axis-aligned paragraph (the common case for screenshots and flat
+                # creatives): rotation is a no-op, so cluster on the plain center y.
+                word_rotated_data: List[Tuple[WordData, float]] = [
+                    (word, (word[2] + word[4]) / 2) for word in para_words
+                ]
+            else:
+                # Compute word centers once; reused for the paragraph centroid and rotation
+                centers_x = [(w[1] + w[3]) / 2 for w in para_words]
+                centers_y = [(w[2] + w[4]) / 2 for w in para_words]
+                para_centroid_x = sum(centers_x) / len(para_words)
+                para_centroid_y = sum(centers_y) / len(para_words)
+
+                angle_rad = radians(-dominant_angle)
+                cos_a = cos(angle_rad)
+                sin_a = sin(angle_rad)
+
+                # Rotate word centers around paragraph centroid. Line clustering only needs
+                # the rotated y (translated back to absolute coordinates).
+                word_rotated_data = [
+                    (
+                        word,
+                        (cx - para_centroid_x) * sin_a
+                        + (cy - para_centroid_y) * cos_a
+                        + para_centroid_y,
+                    )
+                    for word, cx, cy in zip(para_words, centers_x, centers_y)
+                ]
 
             # Compute median word height for threshold
             heights = [w[5] for w in para_words]
@@ -415,68 +614,46 @@ class CloudOcrClient(IOcrClient):
             # Cluster words into lines using rotated y-coordinate
             line_threshold = 0.6 * median_height
 
-            lines: List[List[WordData]] = []
+            # Each line is (words, [x1, y1, x2, y2]); the bbox is the union of the word
+            # boxes, maintained as words are appended. Each word's box is already the
+            # clamped min/max of its own vertices, and clamping is monotonic, so the union
+            # equals the clamped min/max over all line vertices.
+            lines: List[Tuple[List[WordData], List[float]]] = []
 
-            # Sort by rotated y
+            # Sort by rotated y, then sweep once: words arrive in rotated-y order, so a
+            # word either joins the line currently being built (within threshold of its
+            # running mean rotated y) or starts the next line.
             word_rotated_sorted = sorted(word_rotated_data, key=lambda w: w[1])
 
-            for word_data in word_rotated_sorted:
-                word, rotated_y, _ = word_data
-                matched = False
-
-                for line in lines:
-                    if not line:
-                        continue
-
-                    # Compute line's rotated y center (average of rotated y's of words in line)
-                    line_rotated_ys = []
-                    for line_word in line:
-                        # Find this word's rotated y
-                        for wrd, ry, _ in word_rotated_data:
-                            if wrd == line_word:
-                                line_rotated_ys.append(ry)
-                                break
-
-                    if line_rotated_ys:
-                        line_y_rotated = sum(line_rotated_ys) / len(line_rotated_ys)
-
-                        if abs(rotated_y - line_y_rotated) <= line_threshold:
-                            line.append(word)
-                            matched = True
-                            break
-
-                if not matched:
-                    lines.append([word])
+            current_line: List[WordData] = []
+            current_bbox: List[float] = []
+            current_rotated_y_sum = 0.0
+            for word, rotated_y in word_rotated_sorted:
+                if (
+                    current_line
+                    and abs(rotated_y - current_rotated_y_sum / len(current_line)) <= line_threshold
+                ):
+                    current_line.append(word)
+                    current_rotated_y_sum += rotated_y
+                    if word[1] < current_bbox[0]:
+                        current_bbox[0] = word[1]
+                    if word[2] < current_bbox[1]:
+                        current_bbox[1] = word[2]
+                    if word[3] > current_bbox[2]:
+                        current_bbox[2] = word[3]
+                    if word[4] > current_bbox[3]:
+                        current_bbox[3] = word[4]
+                else:
+                    current_line = [word]
+                    current_bbox = [word[1], word[2], word[3], word[4]]
+                    current_rotated_y_sum = rotated_y
+                    lines.append((current_line, current_bbox))
 
             # Create line regions from clustered words
-            for line_words in lines:
-                if not line_words:
-                    continue
-
+            for line_words, (x1, y1, x2, y2) in lines:
                 # Sort words in line by x-coordinate
                 line_words_sorted = sorted(line_words, key=lambda w: w[1])
 
-                # Collect all vertices from words in line
-                all_vertices: List[Tuple[float, float]] = []
-                for word in line_words_sorted:
-                    if word[6]:  # vertices_norm
-                        all_vertices.extend(word[6])
-
-                # Compute line bounding box
-                if all_vertices:
-                    x_coords = [v[0] for v in all_vertices]
-                    y_coords = [v[1] for v in all_vertices]
-                    x1 = max(0.0, min(1.0, min(x_coords)))
-                    y1 = max(0.0, min(1.0, min(y_coords)))
-                    x2 = max(0.0, min(1.0, max(x_coords)))
-                    y2 = max(0.0, min(1.0, max(y_coords)))
-                else:
-                    # Fallback to axis-aligned bbox
-                    x1 = min(w[1] for w in line_words_sorted)
-                    y1 = min(w[2] for w in line_words_sorted)
-                    x2 = max(w[3] for w in line_words_sorted)
-                    y2 = max(w[4] for w in line_words_sorted)
-
                 # Compute line quad (approximate rotated rectangle)
                 # Use axis-aligned bbox corners as quad (acceptable per spec)
                 # Better implementation would project vertices into rotated space, take min/max, then unrotate
@@ -498,13 +675,13 @@ class CloudOcrClient(IOcrClient):
                 # Concatenate words with spaces
                 line_text = " ".join(w[0] for w in line_words_sorted)
 
-                # Create DetectedText with geometry stored in custom attribute
+                # Create DetectedText with geometry stored in its private attribute
                 region = DetectedText(
                     text=line_text,
                     boundingBox=[x1, y1, x2, y2],
                     role="other",
                 )
-                # Store geometry in custom attribute (will be extracted in live_engine)
+                # Store geometry (will be extracted in live_engine)
                 region._geometry = {
                     "quad_norm": quad_norm,
                     "center_norm": center_norm,
@@ -514,76 +691,3 @@ class CloudOcrClient(IOcrClient):
                 all_line_regions.append(region)
 
         return all_line_regions
-
-    def _group_words_into_lines(
-        self, words: List[Tuple[str, float, float, float, float, float]]
-    ) -> List[DetectedText]:
-        """
-        Group word-level annotations into single-line regions using vertical clustering.
-
-        Args:
-            words: List of (text, x1, y1, x2, y2, height) tuples in normalized coordinates
-
-        Returns:
-            List of DetectedText regions, one per line
-        """
-        if not words:
-            return []
-
-        # Sort words by y-coordinate (top to bottom)
-        words_sorted = sorted(words, key=lambda w: (w[2], w[1]))  # Sort by y1, then x1
-
-        # Group words into lines based on vertical overlap
-        # Words are on the same line if their y-coordinates overlap significantly
-        lines: List[List[Tuple[str, float, float, float, float, float]]] = []
-        line_height_threshold = 0.02  # 2% of image height tolerance for line grouping
-
-        for word in words_sorted:
-            text, x1, y1, x2, y2, height = word
-            word_center_y = (y1 + y2) / 2
-
-            # Try to find an existing line this word belongs to
-            matched = False
-            for line in lines:
-                if not line:
-                    continue
-                # Check if word's y-center is within the line's vertical range
-                line_y_min = min(w[2] for w in line)  # min y1
-                line_y_max = max(w[3] for w in line)  # max y2
-                line_center_y = (line_y_min + line_y_max) / 2
-
-                # If word center is close to line center (within threshold), add to line
-                if abs(word_center_y - line_center_y) <= line_height_threshold:
-                    line.append(word)
-                    matched = True
-                    break
-
-            if not matched:
-                # Start a new line
-                lines.append([word])
-
-        # Convert each line to a DetectedText region
-        text_regions: List[DetectedText] = []
-        for line_words in lines:
-            if not line_words:
-                continue
-
-            # Compute tight bounding box around all words in the line
-            x1 = min(w[1] for w in line_words)
-            y1 = min(w[2] for w in line_words)
-            x2 = max(w[3] for w in line_words)
-            y2 = max(w[4] for w in line_words)
-
-            # Concatenate words with spaces
-            line_text = " ".join(w[0] for w in line_words)
-
-            # Default role to "other" - will be classified later
-            text_regions.append(
-                DetectedText(
-                    text=line_text,
-                    boundingBox=[x1, y1, x2, y2],
-                    role="other",
-                )
-            )
-
-        return text_regions
@@ -1,34 +1,109 @@
 """
 Translation client implementations using LLM APIs.
 """
-import json
 import logging
 import time
-from typing import List, Optional
+from typing import Dict, Final, List, Optional
 
-from openai import AsyncOpenAI
+import httpx
+import orjson
+from openai import DEFAULT_TIMEOUT, AsyncOpenAI
 
+from app.clients.http_client import get_http_client
 from app.clients.interfaces import ITranslationClient, TranslatedRegion
 from app.models.jobs import DetectedText
+from app.utils.logging import format_correlation
 
 logger = logging.getLogger("media_promo_localizer")
 
+# Display names for supported target locales (unknown locales are passed through as-is)
+_LOCALE_MAP: Final[Dict[str, str]] = {
+    "fr-FR": "French (France)",
+    "es-MX": "Spanish (Mexico)",
+    "pt-BR": "Portuguese (Brazil)",
+    "ja-JP": "Japanese (Japan)",
+    "de-DE": "German (Germany)",
+    "ko-KR": "Korean (South Korea)",
+    "ru-RU": "Russian (Russia)",
+    "vi-VN": "Vietnamese (Vietnam)",
+}
+
+_SYSTEM_PROMPT: Final = (
+    "You are a professional translator specializing in marketing and promotional materials "
+    "for film and TV. Translate text while preserving tone, style, and cultural context."
+)
+
+# User prompt; filled in with str.format (literal braces are doubled)
+_TRANSLATION_PROMPT_TEMPLATE: Final = """Translate the following text regions from a promotional poster to {locale_name} ({target_locale}).
+
+Rules:
+- Preserve the tone and style appropriate for marketing materials
+- For titles: keep them impactful and cinematic
+- For taglines: adapt creatively (transcreation) rather than literal translation
+- For credits (director, producer, cast names): keep names in original form, translate only role labels
+- For URLs, social handles, and rating badges: do NOT translate, return the original text
+- For release messages: adapt to local date/time formats and cultural context
+
+Return a JSON object with this structure:
+{{
+  "translations": [
+    {{
+      "originalText": "original text here",
+      "translatedText": "translated text here"
+    }}
+  ]
+}}
+
+Text regions to translate:
+{regions_json}
+"""
+
 
 class LlmTranslationClient(ITranslationClient):
     """OpenAI-based translation client."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize OpenAI translation client.
 
         Args:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o-mini)
+            http_client: Optional HTTP client (defaults to the shared process-wide client)
         """
         self.api_key = api_key
         self.model = model
+        self._http_client = http_client
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY is required for live translation mode")
+        # OpenAI SDK client, built on first use (see _get_client)
+        self._client: Optional[AsyncOpenAI] = None
+        self._client_http: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> AsyncOpenAI:
+        """
+        Get the OpenAI SDK client bound to the current HTTP client.
+
+        The HTTP client is resolved at call time, like the OCR client does, so a shared
+        client that was closed and recreated is picked up instead of kept stale. The SDK
+        client is rebuilt only when that HTTP client changes, so calls reuse TLS sessions.
+
+        Returns:
+            AsyncOpenAI client
+        """
+        http_client = self._http_client or get_http_client()
+        if self._client is None or self._client_http is not http_client:
+            # The SDK's own timeout is kept (LLM calls can outlast the pool default)
+            self._client = AsyncOpenAI(
+                api_key=self.api_key, http_client=http_client, timeout=DEFAULT_TIMEOUT
+            )
+            self._client_http = http_client
+        return self._client
 
     async def translate_text_regions(
         self,
@@ -56,41 +131,37 @@ class LlmTranslationClient(ITranslationClient):
         outbound_timestamp = time.time()
 
         # Initialize correlation string and content before try block
-        correlation = []
-        if request_id:
-            correlation.append(f"request={request_id}")
-        if job_id:
-            correlation.append(f"job={job_id}")
-        correlation_str = " ".join(correlation) if correlation else ""
+        correlation_str = format_correlation(request_id, job_id)
 
         # Initialize content to empty string (will be set after API call)
         content = ""
 
         if job_id or request_id:
             logger.info(
-                f"ServiceCall {correlation_str} service=TRANSLATION endpoint={endpoint_base} "
-                f"outbound_timestamp={outbound_timestamp:.3f} model={self.model}"
+                "ServiceCall %s service=TRANSLATION endpoint=%s outbound_timestamp=%.3f model=%s",
+                correlation_str,
+                endpoint_base,
+                outbound_timestamp,
+                self.model,
             )
 
         try:
-            client = AsyncOpenAI(api_key=self.api_key)
+            client = self._get_client()
 
-            # Build prompt for translation
-            # Group regions by role for better context
-            regions_by_role = {}
+            # Repeated texts (e.g. the same badge in several places) are translated once;
+            # the first occurrence supplies the role and box sent as context
+            unique_regions: Dict[str, DetectedText] = {}
             for region in regions:
-                if region.role not in regions_by_role:
-                    regions_by_role[region.role] = []
-                regions_by_role[region.role].append(region)
+                unique_regions.setdefault(region.text, region)
 
-            # Build translation request
+            # Build translation request (each region carries its role for context)
             regions_data = [
                 {
                     "text": region.text,
                     "role": region.role,
                     "boundingBox": region.boundingBox,
                 }
-                for region in regions
+                for region in unique_regions.values()
             ]
 
             prompt = self._build_translation_prompt(regions_data, target_locale)
@@ -102,7 +173,7 @@ class LlmTranslationClient(ITranslationClient):
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a professional translator specializing in marketing and promotional materials for film and TV. Translate text while preserving tone, style, and cultural context.",
+                        "content": _SYSTEM_PROMPT,
                     },
                     {"role": "user", "content": prompt},
                 ],
@@ -121,47 +192,49 @@ class LlmTranslationClient(ITranslationClient):
             response_size = len(content.encode('utf-8')) if content else 0
 
             logger.info(
-                f"ServiceResponse {correlation_str} service=TRANSLATION status={status_code} "
-                f"response_timestamp={response_timestamp:.3f} durationMs={call_duration_ms} "
-                f"responseSizeBytes={response_size}"
+                "ServiceResponse %s service=TRANSLATION status=%d response_timestamp=%.3f "
+                "durationMs=%d responseSizeBytes=%d",
+                correlation_str,
+                status_code,
+                response_timestamp,
+                call_duration_ms,
+                response_size,
             )
             if not content:
                 raise Exception("Empty response from translation API")
 
-            translation_result = json.loads(content)
+            translation_result = orjson.loads(content)
 
             # Map translations back to regions
-            translated_regions: List[TranslatedRegion] = []
             translations = translation_result.get("translations", [])
 
-            # Create a map of original text to translation
+            # Create a map of original text to translation (the reply may be reordered)
             translation_map = {
                 item.get("originalText", ""): item.get("translatedText", "")
                 for item in translations
             }
 
-            for region in regions:
-                translated_text = translation_map.get(region.text, region.text)
-                translated_regions.append(
-                    TranslatedRegion(
-                        original_text=region.text,
-                        translated_text=translated_text,
-                        bounding_box=region.boundingBox,
-                        role=region.role,
-                    )
+            translated_regions: List[TranslatedRegion] = [
+                TranslatedRegion(
+                    original_text=region.text,
+                    translated_text=translation_map.get(region.text, region.text),
+                    bounding_box=region.boundingBox,
+                    role=region.role,
                 )
+                for region in regions
+            ]
 
-            logger.info(
-                f"Translated {len(translated_regions)} regions to {target_locale}"
-            )
+            logger.info("Translated %d regions to %s", len(translated_regions), target_locale)
             return translated_regions
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             response_timestamp = time.time()
             # correlation_str and content are guaranteed to be defined before try block
             logger.error(
-                f"ServiceResponse {correlation_str} service=TRANSLATION status=500 "
-                f"response_timestamp={response_timestamp:.3f} error=JSONDecodeError",
+                "ServiceResponse %s service=TRANSLATION status=500 response_timestamp=%.3f "
+                "error=JSONDecodeError",
+                correlation_str,
+                response_timestamp,
                 exc_info=True,
             )
             raise Exception("Invalid response format from translation API")
@@ -171,8 +244,11 @@ class LlmTranslationClient(ITranslationClient):
             error_name = type(e).__name__ if e else "UnknownError"
             error_message = str(e) if e else "Unknown error"
             logger.error(
-                f"ServiceResponse {correlation_str} service=TRANSLATION status=500 "
-                f"response_timestamp={response_timestamp:.3f} error={error_name}",
+                "ServiceResponse %s service=TRANSLATION status=500 response_timestamp=%.3f "
+                "error=%s",
+                correlation_str,
+                response_timestamp,
+                error_name,
                 exc_info=True,
             )
             raise Exception(f"Translation processing failed: {error_message}")
@@ -190,41 +266,9 @@ class LlmTranslationClient(ITranslationClient):
         Returns:
             Prompt string
         """
-        # Extract locale name for better context
-        locale_map = {
-            "fr-FR": "French (France)",
-            "es-MX": "Spanish (Mexico)",
-            "pt-BR": "Portuguese (Brazil)",
-            "ja-JP": "Japanese (Japan)",
-            "de-DE": "German (Germany)",
-            "ko-KR": "Korean (South Korea)",
-            "ru-RU": "Russian (Russia)",
-            "vi-VN": "Vietnamese (Vietnam)",
-        }
-        locale_name = locale_map.get(target_locale, target_locale)
-
-        prompt = f"""Translate the following text regions from a promotional poster to {locale_name} ({target_locale}).
-
-Rules:
-- Preserve the tone and style appropriate for marketing materials
-- For titles: keep them impactful and cinematic
-- For taglines: adapt creatively (transcreation) rather than literal translation
-- For credits (director, producer, cast names): keep names in original form, translate only role labels
-- For URLs, social handles, and rating badges: do NOT translate, return the original text
-- For release messages: adapt to local date/time formats and cultural context
-
-Return a JSON object with this structure:
-{{
-  "translations": [
-    {{
-      "originalText": "original text here",
-      "translatedText": "translated text here"
-    }}
-  ]
-}}
-
-Text regions to translate:
-{json.dumps(regions_data, indent=2, ensure_ascii=False)}
-"""
-
-        return prompt
+        locale_name = _LOCALE_MAP.get(target_locale, target_locale)
+        return _TRANSLATION_PROMPT_TEMPLATE.format(
+            locale_name=locale_name,
+            target_locale=target_locale,
+            regions_json=orjson.dumps(regions_data, option=orjson.OPT_INDENT_2).decode(),
+        )
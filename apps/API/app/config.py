@@ -9,10 +9,11 @@ Environment variable loading precedence:
 Note: `.env.local` is intended for local development only. Secrets in `.env.local`
 are gitignored and should never be committed to the repository.
 """
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-from pydantic import Field
+from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,7 +25,6 @@ class Settings(BaseSettings):
 
     # File upload limits
     MAX_UPLOAD_MB: int = Field(default=20, description="Maximum upload size in MB")
-    MAX_UPLOAD_SIZE_BYTES: int = Field(default=20 * 1024 * 1024, description="Maximum upload size in bytes")
 
     # Allowed MIME types
     ALLOWED_MIME_TYPES: List[str] = Field(default=["image/jpeg", "image/png"])
@@ -33,9 +33,27 @@ class Settings(BaseSettings):
     MAX_JOBS: int = Field(default=50, description="Maximum number of jobs in store")
     JOB_TTL_SECONDS: int = Field(default=7200, description="Job time-to-live in seconds")
 
+    # CORS (disable when the API is same-origin or a reverse proxy handles CORS)
+    CORS_ENABLED: bool = Field(default=True, description="Enable the CORS middleware")
+
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     TRACE_CALLS: bool = Field(default=False, description="Enable method entry/exit tracing")
+    LOG_BUFFER_CAPACITY: int = Field(
+        default=512, ge=1, description="Log records buffered before the log file is written"
+    )
+    LOG_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=5.0, gt=0, description="Max seconds buffered log records wait before being written"
+    )
+    LOG_FILE_BUFFER_BYTES: int = Field(
+        default=65536, ge=1, description="Write buffer size for the log file"
+    )
+    TELEMETRY_SAMPLE_RATE: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of stub ServiceCall/ServiceResponse pairs to log (errors are never sampled)",
+    )
 
     # Analysis settings (for future use)
     ANALYSIS_MAX_LONG_EDGE_PX: int = Field(default=3072, description="Max long edge for analysis images")
@@ -55,6 +73,27 @@ class Settings(BaseSettings):
     OCR_PROVIDER: str = Field(default="google", description="OCR provider name")
     OCR_API_KEY: Optional[str] = Field(default=None, description="OCR provider API key")
     OCR_API_ENDPOINT: Optional[str] = Field(default=None, description="OCR provider API endpoint")
+    OCR_RESULT_CACHE_SIZE: int = Field(
+        default=64, ge=0, description="Max OCR results cached by image content (0 disables)"
+    )
+
+    # Outbound HTTP connection pool (shared by provider clients)
+    HTTP_MAX_CONNECTIONS: int = Field(default=64, ge=1, description="Max open provider connections")
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=32, ge=0, description="Max idle provider connections kept alive"
+    )
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = Field(
+        default=2.0, gt=0, description="Timeout for establishing a provider connection"
+    )
+    HTTP_READ_TIMEOUT_SECONDS: float = Field(
+        default=25.0, gt=0, description="Timeout for each read of a provider response"
+    )
+    HTTP_WRITE_TIMEOUT_SECONDS: float = Field(
+        default=5.0, gt=0, description="Timeout for each write of a provider request"
+    )
+    HTTP_POOL_TIMEOUT_SECONDS: float = Field(
+        default=1.0, gt=0, description="Timeout for acquiring a connection from the pool"
+    )
 
     # Translation provider settings (for live mode)
     OPENAI_API_KEY: Optional[str] = Field(default=None, description="OpenAI API key")
@@ -81,11 +120,17 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    def __init__(self, **kwargs):
-        """Initialize settings and compute derived fields."""
-        super().__init__(**kwargs)
-        # Compute MAX_UPLOAD_SIZE_BYTES from MAX_UPLOAD_MB
-        self.MAX_UPLOAD_SIZE_BYTES = self.MAX_UPLOAD_MB * 1024 * 1024
+    @computed_field(description="Maximum upload size in bytes (derived from MAX_UPLOAD_MB)")
+    @property
+    def MAX_UPLOAD_SIZE_BYTES(self) -> int:
+        """Maximum upload size in bytes."""
+        return self.MAX_UPLOAD_MB << 20
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance (environment and .env files are read once)."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -1,31 +1,41 @@
 """
 FastAPI application entry point for Media Promo Localizer backend.
 """
+import asyncio
+import atexit
 import logging
+import os
+import queue
 import time
-import uuid
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
+from secrets import token_hex
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.clients.http_client import close_http_client
 from app.config import settings
 from app.routers import health, jobs
 from app.routers.jobs import _get_localization_mode
+from app.services.live_engine import create_live_engine
 from app.utils.errors import APIError, create_error_response
+from app.utils.logging import BatchMemoryHandler, BufferedFileHandler, request_id_var
 
-# Configure logging with both stdout and file handlers
+# Configure logging with both stdout and file handlers. Records are handed to a
+# QueueHandler and written by a QueueListener thread, so request handlers never
+# block the event loop on console/file writes.
 log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+log_formatter = logging.Formatter(log_format)
 
 # Create logs directory if it doesn't exist
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-log_file = log_dir / "app.log"
+log_dir = "logs"
+os.makedirs(log_dir, exist_ok=True)
+log_file = os.path.join(log_dir, "app.log")
 
 # Configure root logger
 root_logger = logging.getLogger()
@@ -37,81 +47,167 @@ root_logger.handlers.clear()
 # StreamHandler for stdout
 stream_handler = logging.StreamHandler()
 stream_handler.setLevel(log_level)
-stream_handler.setFormatter(logging.Formatter(log_format))
-root_logger.addHandler(stream_handler)
+stream_handler.setFormatter(log_formatter)
 
-# FileHandler for logfile
-file_handler = logging.FileHandler(log_file)
+# FileHandler for logfile (large write buffer, flushed once per batch below)
+file_handler = BufferedFileHandler(log_file, buffer_size=settings.LOG_FILE_BUFFER_BYTES)
 file_handler.setLevel(log_level)
-file_handler.setFormatter(logging.Formatter(log_format))
-root_logger.addHandler(file_handler)
+file_handler.setFormatter(log_formatter)
+
+# Batch file writes: records are buffered and written when the buffer fills, on a
+# timer (see lifespan), or immediately for ERROR and above
+file_buffer_handler = BatchMemoryHandler(
+    capacity=settings.LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+)
+file_buffer_handler.setLevel(log_level)
+
+# Only the queue handler is attached to the root logger; the listener drains the queue
+# into the stdout and buffered file handlers. It starts here rather than in the lifespan
+# so records logged at import time or outside a lifespan are written, not left queued.
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+root_logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(
+    log_queue, stream_handler, file_buffer_handler, respect_handler_level=True
+)
+log_listener.start()
+
+
+def _stop_logging() -> None:
+    """Drain the log queue, then write out and close the file handlers at process exit."""
+    log_listener.stop()
+    file_buffer_handler.close()
+    file_handler.close()
+
+
+atexit.register(_stop_logging)
 
 logger = logging.getLogger("media_promo_localizer")
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all HTTP requests with correlation IDs."""
+class RequestLoggingMiddleware:
+    """ASGI middleware to log all HTTP requests with correlation IDs."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         # Get or generate request ID
-        request_id = request.headers.get("X-Request-Id") or str(uuid.uuid4())
-        request.state.request_id = request_id
+        request_id = Headers(scope=scope).get("x-request-id") or token_hex(8)
+        scope.setdefault("state", {})["request_id"] = request_id
+        request_id_token = request_id_var.set(request_id)
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
 
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        # Read request attributes used by every log line once
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
-        # Log request start
-        start_time = time.time()
-        start_timestamp = datetime.now(timezone.utc).isoformat()
+        # Log request start (wall-clock time comes from the log record's asctime)
+        start_time = time.perf_counter()
 
         logger.info(
-            f"RequestStart request={request_id} method={request.method} path={request.url.path} "
-            f"client_ip={client_ip} start_timestamp={start_timestamp}"
+            "RequestStart request=%s method=%s path=%s client_ip=%s",
+            request_id,
+            method,
+            path,
+            client_ip,
         )
 
+        status_code = 500
+        response_started = False
+
+        async def send_with_request_id(message: Message):
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                message.setdefault("headers", []).append(request_id_header)
+            await send(message)
+
         # Process request
         try:
-            response = await call_next(request)
-            status_code = response.status_code
+            await self.app(scope, receive, send_with_request_id)
         except Exception as e:
+            logger.error(
+                "RequestError request=%s method=%s path=%s error=%s",
+                request_id,
+                method,
+                path,
+                type(e).__name__,
+                exc_info=True,
+            )
+            if response_started:
+                request_id_var.reset(request_id_token)
+                raise
             status_code = 500
             response = JSONResponse(
                 status_code=500,
                 content={"error": {"code": "INTERNAL_ERROR", "message": "An unexpected error occurred."}},
             )
-            logger.error(
-                f"RequestError request={request_id} method={request.method} path={request.url.path} "
-                f"error={type(e).__name__}",
-                exc_info=True,
-            )
+            await response(scope, receive, send_with_request_id)
 
         # Calculate duration
-        duration_ms = int((time.time() - start_time) * 1000)
-        end_timestamp = datetime.now(timezone.utc).isoformat()
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
 
         # Log request end
         logger.info(
-            f"RequestEnd request={request_id} method={request.method} path={request.url.path} "
-            f"status={status_code} durationMs={duration_ms} end_timestamp={end_timestamp}"
+            "RequestEnd request=%s method=%s path=%s status=%d durationMs=%d",
+            request_id,
+            method,
+            path,
+            status_code,
+            duration_ms,
         )
 
-        # Add request ID to response headers
-        response.headers["X-Request-Id"] = request_id
-
-        return response
+        request_id_var.reset(request_id_token)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for FastAPI app.
-    Sets startup_time on app.state for uptime tracking.
+    Sets startup_monotonic on app.state for uptime tracking.
     """
-    # Startup: set the startup timestamp
-    app.state.startup_time = datetime.now(timezone.utc)
+    # Startup: write buffered file log records on a timer
+    log_flush_task = asyncio.create_task(_flush_log_buffer_periodically())
+
+    # Anchor uptime on the monotonic clock (immune to wall-clock adjustments)
+    app.state.startup_monotonic = time.monotonic()
 
     # Log resolved configuration (redacting secrets)
     mode = _get_localization_mode()
+    if logger.isEnabledFor(logging.INFO):
+        _log_config(mode)
+    logger.info("Application startup complete")
+    yield
+    # Shutdown: drop cached engines and release pooled provider connections
+    create_live_engine.cache_clear()
+    await close_http_client()
+    logger.info("Application shutdown")
+    # Write out buffered log records; the listener and handlers are closed at exit
+    log_flush_task.cancel()
+    file_buffer_handler.flush()
+
+
+async def _flush_log_buffer_periodically() -> None:
+    """Write buffered file log records at a fixed interval so the log file stays current."""
+    while True:
+        await asyncio.sleep(settings.LOG_FLUSH_INTERVAL_SECONDS)
+        await asyncio.to_thread(file_buffer_handler.flush)
+
+
+def _log_config(mode: str) -> None:
+    """
+    Log the resolved configuration (secrets are redacted).
+
+    Args:
+        mode: Resolved localization mode
+    """
     logger.info("ConfigStart")
     logger.info(f"Config LOCALIZATION_MODE={mode}")
     logger.info(f"Config LOG_LEVEL={settings.LOG_LEVEL}")
@@ -148,10 +244,6 @@ async def lifespan(app: FastAPI):
         logger.info("Config Engine=MockLocalizationEngine")
 
     logger.info("ConfigEnd")
-    logger.info("Application startup complete")
-    yield
-    # Shutdown: cleanup if needed (currently none)
-    logger.info("Application shutdown")
 
 
 app = FastAPI(
@@ -165,13 +257,14 @@ app = FastAPI(
 app.add_middleware(RequestLoggingMiddleware)
 
 # CORS middleware for development
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict this
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+if settings.CORS_ENABLED:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # In production, restrict this
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 
 # Exception handlers
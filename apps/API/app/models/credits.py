@@ -5,12 +5,14 @@ from __future__ import annotations
 
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PointNorm(BaseModel):
     """Normalized point (x, y in range 0.0-1.0)."""
 
+    model_config = ConfigDict(frozen=True)
+
     x: float = Field(ge=0.0, le=1.0)
     y: float = Field(ge=0.0, le=1.0)
 
@@ -18,12 +20,16 @@ class PointNorm(BaseModel):
 class QuadNorm(BaseModel):
     """Normalized quadrilateral (TL, TR, BR, BL vertices)."""
 
+    model_config = ConfigDict(frozen=True)
+
     vertices: List[PointNorm] = Field(min_length=4, max_length=4)
 
 
 class RegionGeometry(BaseModel):
     """Rotation-aware geometry for a text region."""
 
+    model_config = ConfigDict(frozen=True)
+
     quad_norm: QuadNorm
     center_norm: PointNorm
     angle_deg: float
@@ -49,6 +55,8 @@ CreditGroupType = Literal["TITLE", "PROPER_NAME", "CERTIFICATION", "LOGO_IGNORED
 class CreditLine(BaseModel):
     """Single line of text within a credit group."""
 
+    model_config = ConfigDict(frozen=True)
+
     text: str
     geometry: RegionGeometry
     font_height_norm: float  # proxy from quad height
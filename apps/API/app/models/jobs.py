@@ -5,7 +5,9 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional, TYPE_CHECKING, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from app.models.credits import CreditsBandDetection, PointNorm
 
 if TYPE_CHECKING:
     from typing import ForwardRef
@@ -38,17 +40,32 @@ class PipelinePlan(BaseModel):
     enablePackaging: bool = True
 
 
+class StageTimingsMs(BaseModel):
+    """Elapsed time per completed stage in milliseconds (0 until the stage finishes)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    ocr: int = 0
+    translation: int = 0
+    inpaint: int = 0
+    packaging: int = 0
+
+
 class Progress(BaseModel):
     """Job progress information."""
 
+    model_config = ConfigDict(frozen=True)
+
     stage: ProgressStage
     percent: int = Field(ge=0, le=100)
-    stageTimingsMs: dict[str, int] = Field(default_factory=dict)
+    stageTimingsMs: StageTimingsMs = Field(default_factory=StageTimingsMs)
 
 
 class DetectedText(BaseModel):
     """Detected text region with normalized bounding box."""
 
+    model_config = ConfigDict(frozen=True)
+
     text: str
     boundingBox: List[float] = Field(
         description="Normalized coordinates [x1, y1, x2, y2] in range 0.0-1.0"
@@ -56,11 +73,28 @@ class DetectedText(BaseModel):
     role: str = Field(
         description="Text role: title, tagline, credits, rating, other, etc."
     )
+    # Rotation-aware line geometry from OCR (quad_norm, center_norm, angle_deg).
+    # Internal only: not part of the serialized API schema.
+    _geometry: Optional[Dict] = PrivateAttr(default=None)
+
+
+class LineGeometry(BaseModel):
+    """Rotation-aware geometry for an OCR line region."""
+
+    model_config = ConfigDict(frozen=True)
+
+    quad_norm: List[PointNorm] = Field(
+        min_length=4, max_length=4, description="Normalized quad vertices (TL, TR, BR, BL)"
+    )
+    center_norm: PointNorm = Field(description="Normalized line center")
+    angle_deg: float = Field(description="Line angle in degrees")
 
 
 class DebugTextRegion(BaseModel):
     """Debug text region with full metadata for line-level OCR output."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique identifier for this region")
     role: str = Field(description="Text role: title, tagline, credits, legal, other, etc.")
     bbox_norm: List[float] = Field(
@@ -71,7 +105,7 @@ class DebugTextRegion(BaseModel):
         default=None, description="Translated text (if available)"
     )
     is_localizable: bool = Field(description="Whether this region is localizable")
-    geometry: Optional[Dict] = Field(
+    geometry: Optional[LineGeometry] = Field(
         default=None,
         description="Rotation-aware geometry: quad_norm (4 vertices), center_norm (x,y), angle_deg (degrees)"
     )
@@ -80,6 +114,8 @@ class DebugTextRegion(BaseModel):
 class ProcessingTimeMs(BaseModel):
     """Processing time breakdown per stage."""
 
+    model_config = ConfigDict(frozen=True)
+
     ocr: int = 0
     translation: int = 0
     inpaint: int = 0
@@ -163,11 +199,15 @@ class LocalizationJob(BaseModel):
     fileSize: Optional[int] = None
     jobMetadata: Optional[dict] = None
     # Credits detection result (optional, populated during OCR stage)
-    credits_detection: Optional[Dict] = None
+    credits_detection: Optional[CreditsBandDetection] = None
 
     def to_get_response(self) -> GetJobResponse:
-        """Convert internal job to API response format."""
-        return GetJobResponse(
+        """Convert internal job to API response format.
+
+        Every field already holds a validated value (or model instance) on this
+        job, so the response is built without running validation again.
+        """
+        return GetJobResponse.model_construct(
             jobId=self.jobId,
             status=self.status,
             createdAt=self.createdAt,
@@ -2,7 +2,7 @@
 Health check endpoint.
 """
 import time
-from datetime import datetime, timezone
+
 from fastapi import APIRouter, Request
 
 router = APIRouter(tags=["health"])
@@ -13,13 +13,12 @@ async def health(request: Request):
     """
     Basic liveness/uptime check.
     """
-    startup_time = getattr(request.app.state, "startup_time", None)
-    now = datetime.now(timezone.utc)
+    startup_monotonic = getattr(request.app.state, "startup_monotonic", None)
 
-    if startup_time is None:
+    if startup_monotonic is None:
         uptime_seconds = 0
     else:
-        uptime_seconds = int((now - startup_time).total_seconds())
+        uptime_seconds = int(time.monotonic() - startup_monotonic)
 
     return {
         "status": "ok",
@@ -1,18 +1,22 @@
 """
 Localization job endpoints.
 """
+import asyncio
+import io
 import logging
 import os
-import uuid
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
+from secrets import token_hex
 from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile, status
 from fastapi.responses import JSONResponse
+from starlette.formparsers import MultiPartParser
 
 from app.config import settings
-from app.models.jobs import CreateJobResponse, JobStatus, LocalizationJob
+from app.models.jobs import CreateJobResponse, GetJobResponse, JobStatus, LocalizationJob
 from app.services.job_store import get_job_store
 from app.services.mock_engine import run as run_mock_engine
 from app.services.live_engine import create_live_engine
@@ -28,10 +32,16 @@ router = APIRouter()
 UPLOADS_DIR = Path("tmp/uploads")
 UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Chunk size (and file buffer size) used when uploads are copied in user space
+UPLOAD_COPY_CHUNK_BYTES = 1 << 20
+
+# Uploads up to this size are still held in memory by the multipart parser's spooled file
+UPLOAD_SPOOL_MAX_BYTES = MultiPartParser.spool_max_size
+
 
 def _generate_job_id() -> str:
     """Generate a unique job ID."""
-    return f"loc_{uuid.uuid4().hex[:26].upper()}"
+    return f"loc_{token_hex(13).upper()}"
 
 
 def _validate_file(file: UploadFile) -> None:
@@ -61,6 +71,71 @@ def _validate_file(file: UploadFile) -> None:
         )
 
 
+def _payload_too_large_error() -> APIError:
+    """Build the error raised when an upload exceeds MAX_UPLOAD_MB."""
+    return APIError(
+        code=ErrorCodes.PAYLOAD_TOO_LARGE,
+        message=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_MB} MB.",
+        http_status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    )
+
+
+def _copy_upload_to_disk(source, file_path: Path, max_size: int) -> Optional[int]:
+    """
+    Copy an upload's spooled file to disk (runs in a worker thread).
+
+    Uploads small enough to still be held in memory are written with a single
+    write; larger uploads have rolled over to a temporary file and are relayed
+    in-kernel with os.sendfile where supported, with a chunked copy for any rest.
+
+    Args:
+        source: Binary file object holding the upload (usually a SpooledTemporaryFile)
+        file_path: Destination path
+        max_size: Maximum allowed size in bytes
+
+    Returns:
+        Number of bytes written, or None if the upload exceeds max_size
+
+    Raises:
+        OSError: If fewer than the upload's bytes could be written
+    """
+    source.seek(0, os.SEEK_END)
+    file_size = source.tell()
+    if file_size > max_size:
+        return None
+    source.seek(0)
+
+    # Small uploads have not rolled over to disk; asking for their fileno() would
+    # force that, so read them in one call instead
+    if file_size <= UPLOAD_SPOOL_MAX_BYTES:
+        with open(file_path, "wb") as f:
+            f.write(source.read())
+        return file_size
+
+    with open(file_path, "wb", buffering=UPLOAD_COPY_CHUNK_BYTES) as f:
+        offset = 0
+        if hasattr(os, "sendfile"):
+            try:
+                src_fd = source.fileno()
+                while offset < file_size:
+                    sent = os.sendfile(f.fileno(), src_fd, offset, file_size - offset)
+                    if sent == 0:
+                        # Short transfer; the rest is copied in user space below
+                        break
+                    offset += sent
+            except (OSError, io.UnsupportedOperation):
+                # Platform cannot sendfile between these files; copy in user space
+                if offset:
+                    raise
+        if offset < file_size:
+            source.seek(offset)
+            shutil.copyfileobj(source, f, UPLOAD_COPY_CHUNK_BYTES)
+        written = f.tell()
+    if written != file_size:
+        raise OSError(f"Copied {written} of {file_size} upload bytes")
+    return file_size
+
+
 async def _save_uploaded_file(file: UploadFile, job_id: str) -> tuple[str, int]:
     """
     Save uploaded file to disk.
@@ -84,21 +159,18 @@ async def _save_uploaded_file(file: UploadFile, job_id: str) -> tuple[str, int]:
     job_dir.mkdir(parents=True, exist_ok=True)
 
     file_path = job_dir / f"poster{ext}"
-    file_size = 0
+    max_size = settings.MAX_UPLOAD_SIZE_BYTES
+
+    # Reject early when the multipart parser already knows the size
+    if file.size is not None and file.size > max_size:
+        raise _payload_too_large_error()
 
     try:
-        # Read file in chunks to check size
-        with open(file_path, "wb") as f:
-            while chunk := await file.read(8192):
-                file_size += len(chunk)
-                if file_size > settings.MAX_UPLOAD_SIZE_BYTES:
-                    file_path.unlink(missing_ok=True)
-                    raise APIError(
-                        code=ErrorCodes.PAYLOAD_TOO_LARGE,
-                        message=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_MB} MB.",
-                        http_status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    )
-                f.write(chunk)
+        # Copy the spooled upload off the event loop
+        file_size = await asyncio.to_thread(_copy_upload_to_disk, file.file, file_path, max_size)
+        if file_size is None:
+            file_path.unlink(missing_ok=True)
+            raise _payload_too_large_error()
 
         return str(file_path), file_size
     except APIError:
@@ -201,7 +273,11 @@ async def _process_job_background(job: LocalizationJob) -> None:
         job_store.update_job(job)
 
 
-@router.post("/localization-jobs", status_code=status.HTTP_202_ACCEPTED)
+@router.post(
+    "/localization-jobs",
+    response_model=CreateJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def create_localization_job(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
@@ -324,7 +400,7 @@ async def create_localization_job(
         )
 
 
-@router.get("/localization-jobs/{job_id}")
+@router.get("/localization-jobs/{job_id}", response_model=GetJobResponse)
 async def get_localization_job(job_id: str):
     """
     Get localization job status and result.
@@ -2,7 +2,9 @@
 In-memory job store for localization jobs.
 """
 import logging
-from datetime import datetime, timezone
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from app.config import settings
@@ -22,7 +24,10 @@ class JobStore:
             max_jobs: Maximum number of jobs to store (default from config)
             ttl_seconds: Time-to-live for jobs in seconds (default from config)
         """
-        self._jobs: dict[str, LocalizationJob] = {}
+        # Insertion order is creation order, so the oldest job is always first
+        self._jobs: OrderedDict[str, LocalizationJob] = OrderedDict()
+        # Guards _jobs so the store stays consistent if used from worker threads
+        self._lock = threading.Lock()
         self._max_jobs = max_jobs or settings.MAX_JOBS
         self._ttl_seconds = ttl_seconds or settings.JOB_TTL_SECONDS
 
@@ -54,17 +59,6 @@ class JobStore:
         Raises:
             ValueError: If max jobs limit is exceeded
         """
-        # Evict old jobs if we're at capacity
-        if len(self._jobs) >= self._max_jobs:
-            self._evict_old_jobs()
-
-        # If still at capacity, reject
-        if len(self._jobs) >= self._max_jobs:
-            raise ValueError(
-                f"Job store is at capacity ({self._max_jobs} jobs). "
-                "Please wait for jobs to complete or expire."
-            )
-
         now = datetime.now(timezone.utc)
         job = LocalizationJob(
             jobId=job_id,
@@ -79,7 +73,19 @@ class JobStore:
             jobMetadata=job_metadata,
         )
 
-        self._jobs[job_id] = job
+        with self._lock:
+            # Evict old jobs if we're at capacity
+            if len(self._jobs) >= self._max_jobs:
+                self._evict_old_jobs()
+
+            # If still at capacity, reject
+            if len(self._jobs) >= self._max_jobs:
+                raise ValueError(
+                    f"Job store is at capacity ({self._max_jobs} jobs). "
+                    "Please wait for jobs to complete or expire."
+                )
+
+            self._jobs[job_id] = job
         logger.info(f"JobCreated jobId={job_id} targetLang={target_language}")
         return job
 
@@ -99,7 +105,8 @@ class JobStore:
             age_seconds = (datetime.now(timezone.utc) - job.createdAt).total_seconds()
             if age_seconds > self._ttl_seconds:
                 logger.debug(f"Job {job_id} has expired (age: {age_seconds}s)")
-                del self._jobs[job_id]
+                with self._lock:
+                    self._jobs.pop(job_id, None)
                 return None
         return job
 
@@ -110,35 +117,32 @@ class JobStore:
         Args:
             job: Updated LocalizationJob
         """
-        if job.jobId not in self._jobs:
-            raise ValueError(f"Job {job.jobId} not found in store")
+        with self._lock:
+            if job.jobId not in self._jobs:
+                raise ValueError(f"Job {job.jobId} not found in store")
 
-        job.updatedAt = datetime.now(timezone.utc)
-        self._jobs[job.jobId] = job
+            job.updatedAt = datetime.now(timezone.utc)
+            self._jobs[job.jobId] = job
         logger.debug(f"JobUpdated jobId={job.jobId} status={job.status}")
 
     def _evict_old_jobs(self) -> None:
-        """Evict jobs that have exceeded TTL."""
-        now = datetime.now(timezone.utc)
-        expired_jobs = [
-            job_id
-            for job_id, job in self._jobs.items()
-            if (now - job.createdAt).total_seconds() > self._ttl_seconds
-        ]
-
-        for job_id in expired_jobs:
-            del self._jobs[job_id]
+        """Evict jobs that have exceeded TTL, then the oldest jobs if still at capacity.
+
+        Must be called with _lock held.
+        """
+        # All jobs share one TTL, so expired jobs form a prefix of the creation order
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self._ttl_seconds)
+        while self._jobs:
+            job_id, job = next(iter(self._jobs.items()))
+            if job.createdAt >= cutoff:
+                break
+            self._jobs.popitem(last=False)
             logger.debug(f"Evicted expired job {job_id}")
 
         # If still at capacity, evict oldest jobs
-        if len(self._jobs) >= self._max_jobs:
-            sorted_jobs = sorted(
-                self._jobs.items(), key=lambda x: x[1].createdAt
-            )
-            num_to_evict = len(self._jobs) - self._max_jobs + 1
-            for job_id, _ in sorted_jobs[:num_to_evict]:
-                del self._jobs[job_id]
-                logger.debug(f"Evicted oldest job {job_id} to make room")
+        while self._jobs and len(self._jobs) >= self._max_jobs:
+            job_id, _ = self._jobs.popitem(last=False)
+            logger.debug(f"Evicted oldest job {job_id} to make room")
 
 
 # Global singleton instance
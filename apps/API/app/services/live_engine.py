@@ -6,16 +6,30 @@ This engine implements the full pipeline with real external services:
 - Translation: OpenAI (or other LLM)
 - Inpainting: Stub (deferred per FuncTechSpec out-of-scope)
 """
+import asyncio
+import functools
 import logging
+import re
+import shutil
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
 from app.clients.inpainting_client import StubInpaintingClient
-from app.clients.interfaces import IOcrClient, IInpaintingClient, ITranslationClient, TranslatedRegion
+from app.clients.interfaces import (
+    IInpaintingClient,
+    IOcrClient,
+    ITranslationClient,
+    OcrError,
+    OcrResult,
+    OcrTimeout,
+    TranslatedRegion,
+)
 from app.clients.ocr_client import CloudOcrClient
 from app.clients.translation_client import LlmTranslationClient
 from app.config import settings
+from app.models.credits import CreditsBandDetection
 from app.models.jobs import (
     DebugInfo,
     DebugTextRegion,
@@ -27,6 +41,7 @@ from app.models.jobs import (
     ProcessingTimeMs,
     Progress,
     ProgressStage,
+    StageTimingsMs,
 )
 from app.utils.credits_detection import (
     detect_credits_band,
@@ -35,9 +50,16 @@ from app.utils.credits_detection import (
 )
 from app.utils.image_cache import get_image_cache
 from app.utils.image_derivatives import get_image_dimensions, maybe_make_derivative
+from app.utils.ocr_cache import get_ocr_result_cache
 
 logger = logging.getLogger("media_promo_localizer")
 
+# Role keyword patterns, matched against upper-cased region text
+_TAGLINE_RE = re.compile(r"COMING SOON|NOW PLAYING|IN THEATERS")
+_CREDITS_RE = re.compile(r"DIRECTED BY|PRODUCED BY")
+# URLs and social handles (locked, never localized)
+_URL_OR_HANDLE_RE = re.compile(r"HTTP|WWW\.|@")
+
 
 class LiveLocalizationEngine:
     """Live localization engine using real providers."""
@@ -72,6 +94,10 @@ class LiveLocalizationEngine:
         Returns:
             Updated LocalizationJob with result or error
         """
+        # Background stage tasks (started after OCR); the finally block cancels any
+        # still pending, e.g. when a later stage fails or raises
+        credits_task: Optional[asyncio.Task] = None
+        inpaint_task: Optional[asyncio.Task] = None
         try:
             job.status = JobStatus.PROCESSING
             job.updatedAt = datetime.now(timezone.utc)
@@ -87,8 +113,8 @@ class LiveLocalizationEngine:
                 image_path = Path(job.filePath)
                 if not image_path.exists():
                     raise FileNotFoundError(f"Image file not found: {job.filePath}")
-                with open(image_path, "rb") as f:
-                    original_image_bytes = f.read()
+                # Read off the event loop so other requests keep being served
+                original_image_bytes = await asyncio.to_thread(image_path.read_bytes)
 
                 # Try to cache it for future use
                 try:
@@ -137,10 +163,13 @@ class LiveLocalizationEngine:
                     # In future, this could use an LLM for more sophisticated classification
                     classified_regions = self._classify_text_regions(ocr_result.text_regions)
                 except Exception as e:
-                    logger.error(f"OCR failed for job {job.jobId}: {e}", exc_info=True)
+                    # Provider errors (OcrError) were already logged by the client
+                    logger.error(
+                        f"OCR failed for job {job.jobId}: {e}", exc_info=not isinstance(e, OcrError)
+                    )
                     job.status = JobStatus.FAILED
                     job.error = ErrorInfo(
-                        code="OCR_MODEL_ERROR",
+                        code="OCR_MODEL_TIMEOUT" if isinstance(e, OcrTimeout) else "OCR_MODEL_ERROR",
                         message=f"OCR processing failed: {str(e)}",
                         retryable=True,
                     )
@@ -151,10 +180,11 @@ class LiveLocalizationEngine:
                     )
                     return job
 
-            job.progress = Progress(
+            # Progress values are computed here, so skip pydantic validation
+            job.progress = Progress.model_construct(
                 stage=ProgressStage.OCR,
                 percent=25,
-                stageTimingsMs={"ocr": ocr_time_ms},
+                stageTimingsMs=StageTimingsMs.model_construct(ocr=ocr_time_ms),
             )
             job.updatedAt = datetime.now(timezone.utc)
             logger.info(
@@ -162,81 +192,20 @@ class LiveLocalizationEngine:
                 f"durationMs={ocr_time_ms} skipped={skipped} regions={len(classified_regions)}"
             )
 
-            # Credits detection (after OCR, before translation)
-            credits_detection = None
+            # Credits detection (after OCR). It is additive and independent of translation,
+            # so it runs as a background task (including its crop OCR round trip) while the
+            # translation request is in flight.
             if not skipped and classified_regions and ocr_result is not None:
-                try:
-                    # Get image dimensions for credits detection
-                    image_width = ocr_result.image_width
-                    image_height = ocr_result.image_height
-
-                    if image_width > 0 and image_height > 0:
-                        credits_detection = detect_credits_band(
-                            line_regions=ocr_result.text_regions,
-                            original_image_bytes=original_image_bytes,
-                            image_width=image_width,
-                            image_height=image_height,
-                            job_id=job.jobId,
-                        )
-
-                        # If credits block detected, extract crop and run specialized OCR + grouping
-                        if (
-                            credits_detection
-                            and credits_detection.credits_block
-                            and credits_detection.credits_block.geometry
-                        ):
-                            # Extract crop
-                            crop_bytes, crop_method = extract_credits_crop(
-                                original_image_bytes=original_image_bytes,
-                                credits_block_geometry=credits_detection.credits_block.geometry,
-                                image_width=image_width,
-                                image_height=image_height,
-                                job_id=job.jobId,
-                            )
-
-                            # Run OCR on crop
-                            crop_ocr_result = await self.ocr_client.recognize_text(
-                                crop_bytes, job_id=job.jobId
-                            )
-
-                            # Get crop dimensions
-                            crop_width = crop_ocr_result.image_width
-                            crop_height = crop_ocr_result.image_height
-
-                            logger.info(
-                                f"CreditsOcrSummary job={job.jobId} lines={len(crop_ocr_result.text_regions)} "
-                                f"median_font_height=N/A angle={credits_detection.credits_block.dominant_angle_deg:.1f} "
-                                f"crop_method={crop_method}"
-                            )
-
-                            # Log first N lines
-                            preview_lines = [
-                                r.text[:80] for r in crop_ocr_result.text_regions[:5]
-                            ]
-                            logger.info(
-                                f"CreditsOcrPreview job={job.jobId} first_lines={preview_lines}"
-                            )
-
-                            # Group credits lines
-                            credit_groups = group_credits_lines(
-                                line_regions=crop_ocr_result.text_regions,
-                                image_width=crop_width,
-                                image_height=crop_height,
-                                job_id=job.jobId,
-                            )
-
-                            # Update credits block with groups
-                            credits_detection.credits_block.credit_groups = credit_groups
-
-                except Exception as e:
-                    # Log error but don't fail the job (credits detection is additive)
-                    logger.warning(
-                        f"CreditsDetectionError job={job.jobId} error={str(e)}", exc_info=True
-                    )
+                credits_task = asyncio.create_task(
+                    self._detect_credits(job.jobId, ocr_result, original_image_bytes)
+                )
 
-            # Store credits detection in job
-            if credits_detection:
-                job.credits_detection = credits_detection.model_dump()
+            # Inpainting only needs the classified OCR regions, not translations, so it
+            # also starts now and overlaps the translation request (awaited in stage 3)
+            if not settings.SKIP_INPAINT:
+                inpaint_task = asyncio.create_task(
+                    self._inpaint(job.jobId, original_image_bytes, classified_regions)
+                )
 
             # Stage 2: Translation
             stage_name = "TRANSLATION"
@@ -271,7 +240,7 @@ class LiveLocalizationEngine:
                     ]
 
                     translated_regions = await self.translation_client.translate_text_regions(
-                        localizable_regions, job.targetLanguage
+                        localizable_regions, job.targetLanguage, job_id=job.jobId
                     )
 
                     translation_time_ms = max(1, int((time.perf_counter() - translation_start) * 1000))
@@ -292,13 +261,13 @@ class LiveLocalizationEngine:
                     )
                     return job
 
-            job.progress = Progress(
+            job.progress = Progress.model_construct(
                 stage=ProgressStage.TRANSLATION,
                 percent=50,
-                stageTimingsMs={
-                    "ocr": ocr_time_ms,
-                    "translation": translation_time_ms,
-                },
+                stageTimingsMs=StageTimingsMs.model_construct(
+                    ocr=ocr_time_ms,
+                    translation=translation_time_ms,
+                ),
             )
             job.updatedAt = datetime.now(timezone.utc)
             logger.info(
@@ -306,7 +275,13 @@ class LiveLocalizationEngine:
                 f"durationMs={translation_time_ms} skipped={skipped} translated={len(translated_regions)}"
             )
 
-            # Stage 3: Inpainting (stub - returns original image)
+            # Collect credits detection started after OCR and store it in job
+            if credits_task is not None:
+                credits_detection = await credits_task
+                if credits_detection:
+                    job.credits_detection = credits_detection
+
+            # Stage 3: Inpainting (stub - returns original image), started after OCR
             stage_name = "INPAINT"
             logger.info(f"PipelineStageStart job={job.jobId} stage={stage_name}")
             inpaint_start = time.perf_counter()
@@ -325,16 +300,7 @@ class LiveLocalizationEngine:
                 inpaint_time_ms = max(1, int((time.perf_counter() - inpaint_start) * 1000))
             else:
                 try:
-                    # Get inpainting image bytes (derivative if needed)
-                    inpaint_image_bytes = self._get_image_for_step(
-                        job.jobId, "INPAINT", original_image_bytes, settings.INPAINT_IMAGE_LONG_SIDE_PX
-                    )
-
-                    # Use stub inpainting (returns original image)
-                    inpainted_image_bytes = await self.inpainting_client.inpaint_regions(
-                        inpaint_image_bytes, classified_regions
-                    )
-                    inpaint_time_ms = max(1, int((time.perf_counter() - inpaint_start) * 1000))
+                    inpainted_image_bytes, inpaint_time_ms = await inpaint_task
                 except Exception as e:
                     logger.error(
                         f"Inpainting failed for job {job.jobId}: {e}", exc_info=True
@@ -352,14 +318,14 @@ class LiveLocalizationEngine:
                     )
                     return job
 
-            job.progress = Progress(
+            job.progress = Progress.model_construct(
                 stage=ProgressStage.INPAINT,
                 percent=75,
-                stageTimingsMs={
-                    "ocr": ocr_time_ms,
-                    "translation": translation_time_ms,
-                    "inpaint": inpaint_time_ms,
-                },
+                stageTimingsMs=StageTimingsMs.model_construct(
+                    ocr=ocr_time_ms,
+                    translation=translation_time_ms,
+                    inpaint=inpaint_time_ms,
+                ),
             )
             job.updatedAt = datetime.now(timezone.utc)
             logger.info(
@@ -391,18 +357,21 @@ class LiveLocalizationEngine:
                 else:
                     output_dir = Path("tmp/uploads") / job.jobId
                 output_path = output_dir / "output.png"
-                with open(output_path, "wb") as f:
-                    f.write(original_image_bytes)
+                await asyncio.to_thread(
+                    _write_output_image, output_path, original_image_bytes, job.filePath
+                )
                 packaging_time_ms = max(1, int((time.perf_counter() - packaging_start) * 1000))
 
+            # Index translations by original text (first match wins, as before)
+            translation_by_text: dict[str, TranslatedRegion] = {}
+            for tr in translated_regions:
+                translation_by_text.setdefault(tr.original_text, tr)
+
             # Build detected text list for result (mix of original and translated)
             detected_text_list: list[DetectedText] = []
             for region in classified_regions:
                 # Find translation if available
-                translated = next(
-                    (tr for tr in translated_regions if tr.original_text == region.text),
-                    None,
-                )
+                translated = translation_by_text.get(region.text)
                 text_to_show = (
                     translated.translated_text if translated else region.text
                 )
@@ -418,15 +387,10 @@ class LiveLocalizationEngine:
             debug_regions: list[DebugTextRegion] = []
             for i, region in enumerate(classified_regions):
                 # Find translation if available
-                translated = next(
-                    (tr for tr in translated_regions if tr.original_text == region.text),
-                    None,
-                )
+                translated = translation_by_text.get(region.text)
 
-                # Extract geometry if available (stored in _geometry attribute from OCR)
-                geometry = None
-                if hasattr(region, "_geometry"):
-                    geometry = region._geometry
+                # Geometry from OCR (None for regions without rotation-aware geometry)
+                geometry = region._geometry
 
                 # Convert boundingBox [x1, y1, x2, y2] to bbox_norm [x, y, width, height]
                 bbox = region.boundingBox
@@ -458,15 +422,15 @@ class LiveLocalizationEngine:
                 ocr_time_ms + translation_time_ms + inpaint_time_ms + packaging_time_ms
             )
 
-            job.progress = Progress(
+            job.progress = Progress.model_construct(
                 stage=ProgressStage.PACKAGING,
                 percent=100,
-                stageTimingsMs={
-                    "ocr": ocr_time_ms,
-                    "translation": translation_time_ms,
-                    "inpaint": inpaint_time_ms,
-                    "packaging": packaging_time_ms,
-                },
+                stageTimingsMs=StageTimingsMs.model_construct(
+                    ocr=ocr_time_ms,
+                    translation=translation_time_ms,
+                    inpaint=inpaint_time_ms,
+                    packaging=packaging_time_ms,
+                ),
             )
             job.updatedAt = datetime.now(timezone.utc)
 
@@ -498,13 +462,13 @@ class LiveLocalizationEngine:
             job.status = JobStatus.SUCCEEDED
             job.updatedAt = datetime.now(timezone.utc)
             logger.info(
-                f"JobCompleted jobId={job.jobId} status=succeeded durationMs={total_time_ms}"
+                "JobCompleted jobId=%s status=succeeded durationMs=%d", job.jobId, total_time_ms
             )
 
             return job
 
         except Exception as e:
-            logger.error(f"JobFailed jobId={job.jobId} error={str(e)}", exc_info=True)
+            logger.error("JobFailed jobId=%s error=%s", job.jobId, e, exc_info=True)
             job.status = JobStatus.FAILED
             job.error = ErrorInfo(
                 code="INTERNAL_ERROR",
@@ -513,6 +477,127 @@ class LiveLocalizationEngine:
             )
             job.updatedAt = datetime.now(timezone.utc)
             return job
+        finally:
+            _discard_task(credits_task)
+            _discard_task(inpaint_task)
+            # Derivatives are only reused within a run; drop them so a cached engine
+            # does not keep every job's image bytes alive
+            self._discard_derivatives(job.jobId)
+
+    async def _inpaint(
+        self, job_id: str, original_image_bytes: bytes, regions: list[DetectedText]
+    ) -> tuple[bytes, int]:
+        """
+        Run inpainting for the classified regions.
+
+        Args:
+            job_id: Job identifier
+            original_image_bytes: Full-resolution original image bytes
+            regions: Classified text regions
+
+        Returns:
+            Tuple of (inpainted image bytes, elapsed milliseconds)
+        """
+        inpaint_start = time.perf_counter()
+
+        # Get inpainting image bytes (derivative if needed)
+        inpaint_image_bytes = self._get_image_for_step(
+            job_id, "INPAINT", original_image_bytes, settings.INPAINT_IMAGE_LONG_SIDE_PX
+        )
+
+        # Use stub inpainting (returns original image)
+        inpainted_image_bytes = await self.inpainting_client.inpaint_regions(
+            inpaint_image_bytes, regions, job_id=job_id
+        )
+        return inpainted_image_bytes, max(1, int((time.perf_counter() - inpaint_start) * 1000))
+
+    async def _detect_credits(
+        self, job_id: str, ocr_result: OcrResult, original_image_bytes: bytes
+    ) -> Optional[CreditsBandDetection]:
+        """
+        Detect the credits block and run specialized OCR + grouping on its crop.
+
+        Errors are logged and swallowed; credits detection never fails the job.
+
+        Args:
+            job_id: Job identifier
+            ocr_result: Full-image OCR result
+            original_image_bytes: Full-resolution original image bytes
+
+        Returns:
+            Credits detection result, or None if nothing was detected or detection failed
+        """
+        credits_detection = None
+        try:
+            # Get image dimensions for credits detection
+            image_width = ocr_result.image_width
+            image_height = ocr_result.image_height
+
+            if image_width > 0 and image_height > 0:
+                credits_detection = detect_credits_band(
+                    line_regions=ocr_result.text_regions,
+                    original_image_bytes=original_image_bytes,
+                    image_width=image_width,
+                    image_height=image_height,
+                    job_id=job_id,
+                )
+
+                # If credits block detected, extract crop and run specialized OCR + grouping
+                if (
+                    credits_detection
+                    and credits_detection.credits_block
+                    and credits_detection.credits_block.geometry
+                ):
+                    # Extract crop
+                    crop_bytes, crop_method = extract_credits_crop(
+                        original_image_bytes=original_image_bytes,
+                        credits_block_geometry=credits_detection.credits_block.geometry,
+                        image_width=image_width,
+                        image_height=image_height,
+                        job_id=job_id,
+                    )
+
+                    # Run OCR on crop
+                    crop_ocr_result = await self.ocr_client.recognize_text(
+                        crop_bytes, job_id=job_id
+                    )
+
+                    # Get crop dimensions
+                    crop_width = crop_ocr_result.image_width
+                    crop_height = crop_ocr_result.image_height
+
+                    logger.info(
+                        f"CreditsOcrSummary job={job_id} lines={len(crop_ocr_result.text_regions)} "
+                        f"median_font_height=N/A angle={credits_detection.credits_block.dominant_angle_deg:.1f} "
+                        f"crop_method={crop_method}"
+                    )
+
+                    # Log first N lines
+                    preview_lines = [
+                        r.text[:80] for r in crop_ocr_result.text_regions[:5]
+                    ]
+                    logger.info(
+                        f"CreditsOcrPreview job={job_id} first_lines={preview_lines}"
+                    )
+
+                    # Group credits lines
+                    credit_groups = group_credits_lines(
+                        line_regions=crop_ocr_result.text_regions,
+                        image_width=crop_width,
+                        image_height=crop_height,
+                        job_id=job_id,
+                    )
+
+                    # Update credits block with groups
+                    credits_detection.credits_block.credit_groups = credit_groups
+
+        except Exception as e:
+            # Log error but don't fail the job (credits detection is additive)
+            logger.warning(
+                f"CreditsDetectionError job={job_id} error={str(e)}", exc_info=True
+            )
+
+        return credits_detection
 
     def _get_image_for_step(
         self, job_id: str, step: str, original_bytes: bytes, target_long_side_px: int
@@ -569,6 +654,16 @@ class LiveLocalizationEngine:
             self._derivative_cache[cache_key] = original_bytes
             return original_bytes
 
+    def _discard_derivatives(self, job_id: str) -> None:
+        """
+        Remove a job's entries from the derivative cache.
+
+        Args:
+            job_id: Job identifier
+        """
+        for cache_key in [key for key in self._derivative_cache if key[0] == job_id]:
+            del self._derivative_cache[cache_key]
+
     def _classify_text_regions(self, regions: list[DetectedText]) -> list[DetectedText]:
         """
         Classify text regions by semantic role using simple heuristics.
@@ -585,14 +680,11 @@ class LiveLocalizationEngine:
             role = region.role
 
             # Simple heuristics for role classification
-            if any(
-                keyword in text_upper
-                for keyword in ["COMING SOON", "NOW PLAYING", "IN THEATERS"]
-            ):
+            if _TAGLINE_RE.search(text_upper):
                 role = "tagline"
-            elif any(keyword in text_upper for keyword in ["DIRECTED BY", "PRODUCED BY"]):
+            elif _CREDITS_RE.search(text_upper):
                 role = "credits"
-            elif "HTTP" in text_upper or "WWW." in text_upper or "@" in text_upper:
+            elif _URL_OR_HANDLE_RE.search(text_upper):
                 role = "other"  # URLs/social handles - locked
             elif len(text_upper) > 30:
                 # Likely a title if it's long
@@ -601,7 +693,8 @@ class LiveLocalizationEngine:
                 # Likely a date or rating
                 role = "other"
 
-            classified.append(DetectedText(text=region.text, boundingBox=region.boundingBox, role=role))
+            # Copy so OCR geometry carries over to the classified region
+            classified.append(region.model_copy(update={"role": role}))
 
         return classified
 
@@ -616,8 +709,7 @@ class LiveLocalizationEngine:
             True if region should be localized, False if locked
         """
         # Per FuncTechSpec: URLs, social handles, rating badges are locked
-        text_upper = region.text.upper()
-        if "HTTP" in text_upper or "WWW." in text_upper or "@" in text_upper:
+        if _URL_OR_HANDLE_RE.search(region.text.upper()):
             return False
 
         # Per spec: titles are locked by default (configurable per market/script in future)
@@ -632,6 +724,41 @@ class LiveLocalizationEngine:
         return True
 
 
+def _write_output_image(output_path: Path, image_bytes: bytes, source_path: Optional[str]) -> None:
+    """
+    Write the packaged output image (runs in a worker thread).
+
+    The output is currently the unmodified original, so when the uploaded file is
+    available it is copied with shutil.copyfile, which uses in-kernel copying
+    (sendfile) on Linux instead of writing the bytes back out from Python.
+
+    Args:
+        output_path: Destination path
+        image_bytes: Original image bytes (used if the upload is missing)
+        source_path: Path of the uploaded original, if known
+    """
+    if source_path:
+        try:
+            shutil.copyfile(source_path, output_path)
+            return
+        except FileNotFoundError:
+            pass
+    output_path.write_bytes(image_bytes)
+
+
+def _discard_task(task: Optional[asyncio.Task]) -> None:
+    """Cancel a background stage task whose result is no longer needed."""
+    if task is None:
+        return
+    if task.done():
+        # Retrieve any exception so asyncio does not report it as unhandled
+        if not task.cancelled():
+            task.exception()
+    else:
+        task.cancel()
+
+
+@functools.lru_cache(maxsize=8)
 def create_live_engine(
     ocr_api_key: str,
     ocr_api_endpoint: str | None,
@@ -641,6 +768,10 @@ def create_live_engine(
     """
     Factory function to create a LiveLocalizationEngine with configured clients.
 
+    Engines keep no per-job state once a run finishes, so one engine per
+    configuration is cached and reused across jobs (clear with
+    create_live_engine.cache_clear()).
+
     Args:
         ocr_api_key: OCR provider API key
         ocr_api_endpoint: Optional OCR API endpoint
@@ -650,7 +781,11 @@ def create_live_engine(
     Returns:
         Configured LiveLocalizationEngine instance
     """
-    ocr_client = CloudOcrClient(api_key=ocr_api_key, api_endpoint=ocr_api_endpoint)
+    # Share one result cache across jobs so reprocessing the same asset skips the OCR call
+    ocr_cache = get_ocr_result_cache() if settings.OCR_RESULT_CACHE_SIZE > 0 else None
+    ocr_client = CloudOcrClient(
+        api_key=ocr_api_key, api_endpoint=ocr_api_endpoint, cache=ocr_cache
+    )
     translation_client = LlmTranslationClient(api_key=openai_api_key, model=translation_model)
     inpainting_client = StubInpaintingClient()
 
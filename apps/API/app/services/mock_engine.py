@@ -18,6 +18,7 @@ from app.models.jobs import (
     ProcessingTimeMs,
     Progress,
     ProgressStage,
+    StageTimingsMs,
 )
 
 logger = logging.getLogger("media_promo_localizer")
@@ -56,7 +57,7 @@ async def run(job: LocalizationJob) -> LocalizationJob:
         job.progress = Progress(
             stage=ProgressStage.OCR,
             percent=25,
-            stageTimingsMs={"ocr": ocr_time_ms},
+            stageTimingsMs=StageTimingsMs(ocr=ocr_time_ms),
         )
         job.updatedAt = datetime.now(timezone.utc)
         logger.info(
@@ -83,10 +84,10 @@ async def run(job: LocalizationJob) -> LocalizationJob:
         job.progress = Progress(
             stage=ProgressStage.TRANSLATION,
             percent=50,
-            stageTimingsMs={
-                "ocr": ocr_time_ms,
-                "translation": translation_time_ms,
-            },
+            stageTimingsMs=StageTimingsMs(
+                ocr=ocr_time_ms,
+                translation=translation_time_ms,
+            ),
         )
         job.updatedAt = datetime.now(timezone.utc)
         logger.info(
@@ -113,11 +114,11 @@ async def run(job: LocalizationJob) -> LocalizationJob:
         job.progress = Progress(
             stage=ProgressStage.INPAINT,
             percent=75,
-            stageTimingsMs={
-                "ocr": ocr_time_ms,
-                "translation": translation_time_ms,
-                "inpaint": inpaint_time_ms,
-            },
+            stageTimingsMs=StageTimingsMs(
+                ocr=ocr_time_ms,
+                translation=translation_time_ms,
+                inpaint=inpaint_time_ms,
+            ),
         )
         job.updatedAt = datetime.now(timezone.utc)
         logger.info(
@@ -150,12 +151,12 @@ async def run(job: LocalizationJob) -> LocalizationJob:
         job.progress = Progress(
             stage=ProgressStage.PACKAGING,
             percent=100,
-            stageTimingsMs={
-                "ocr": ocr_time_ms,
-                "translation": translation_time_ms,
-                "inpaint": inpaint_time_ms,
-                "packaging": packaging_time_ms,
-            },
+            stageTimingsMs=StageTimingsMs(
+                ocr=ocr_time_ms,
+                translation=translation_time_ms,
+                inpaint=inpaint_time_ms,
+                packaging=packaging_time_ms,
+            ),
         )
         job.updatedAt = datetime.now(timezone.utc)
 
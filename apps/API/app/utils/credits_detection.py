@@ -612,7 +612,6 @@ def extract_credits_crop(
     correlation = f"job={job_id}" if job_id else ""
 
     try:
-        image = Image.open(BytesIO(original_image_bytes))
         bbox_norm = credits_block_geometry.bbox_norm
 
         if not bbox_norm or len(bbox_norm) < 4:
@@ -633,7 +632,9 @@ def extract_credits_crop(
 
         # For now, use axis-aligned crop (per spec note)
         crop_box = (x1_px, y1_px, x2_px, y2_px)
-        cropped_image = image.crop(crop_box)
+        # crop() loads the pixels it needs, so the source decoder can be closed right after
+        with Image.open(BytesIO(original_image_bytes)) as image:
+            cropped_image = image.crop(crop_box)
 
         # Save to bytes
         output = BytesIO()
@@ -78,15 +78,15 @@ def geometry_from_detected_text(region, image_width: int, image_height: int) ->
     Convert DetectedText region to RegionGeometry.
 
     Args:
-        region: DetectedText with _geometry attribute or boundingBox
+        region: DetectedText with OCR geometry or boundingBox
         image_width: Image width in pixels
         image_height: Image height in pixels
 
     Returns:
         RegionGeometry or None if cannot extract
     """
-    # Try to get geometry from _geometry attribute (from OCR client)
-    if hasattr(region, "_geometry") and region._geometry:
+    # Try to get geometry from the OCR client first
+    if getattr(region, "_geometry", None):
         geom_dict = region._geometry
         quad_vertices = geom_dict.get("quad_norm", [])
         center = geom_dict.get("center_norm", {})
@@ -7,6 +7,7 @@ This module provides functions to:
 - Generate derivatives only when needed
 """
 import logging
+import struct
 from io import BytesIO
 from typing import Optional, Tuple
 
@@ -14,11 +15,69 @@ from PIL import Image
 
 logger = logging.getLogger("media_promo_localizer")
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (SOF0-SOF15, excluding DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _read_header_dimensions(image_bytes: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read dimensions from the PNG IHDR chunk or JPEG SOF segment without decoding.
+
+    Args:
+        image_bytes: Image file bytes
+
+    Returns:
+        Tuple of (width, height) in pixels, or None if the header is not recognized
+    """
+    size = len(image_bytes)
+
+    # PNG: IHDR is always the first chunk; width/height are big-endian at bytes 16-24
+    if image_bytes[:8] == _PNG_SIGNATURE:
+        if size >= 24 and image_bytes[12:16] == b"IHDR":
+            width, height = struct.unpack_from(">II", image_bytes, 16)
+            if width and height:
+                return width, height
+        return None
+
+    # JPEG: walk marker segments until the first SOF marker
+    if image_bytes[:2] != b"\xff\xd8":
+        return None
+    offset = 2
+    while offset + 4 <= size:
+        if image_bytes[offset] != 0xFF:
+            return None
+        marker = image_bytes[offset + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            offset += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Standalone markers carry no length
+            offset += 2
+            continue
+        if marker in (0xD9, 0xDA):
+            # End of image / start of scan reached without a frame header
+            return None
+        if marker in _JPEG_SOF_MARKERS:
+            if offset + 9 > size:
+                return None
+            height, width = struct.unpack_from(">HH", image_bytes, offset + 5)
+            if width and height:
+                return width, height
+            return None
+        (segment_length,) = struct.unpack_from(">H", image_bytes, offset + 2)
+        offset += 2 + segment_length
+    return None
+
 
 def get_image_dimensions(image_bytes: bytes) -> Tuple[int, int]:
     """
     Get image dimensions from image bytes.
 
+    PNG and JPEG dimensions are read straight from the file header; other
+    formats fall back to PIL.
+
     Args:
         image_bytes: Image file bytes
 
@@ -28,9 +87,13 @@ def get_image_dimensions(image_bytes: bytes) -> Tuple[int, int]:
     Raises:
         ValueError: If image cannot be decoded
     """
+    dimensions = _read_header_dimensions(image_bytes)
+    if dimensions is not None:
+        return dimensions
+
     try:
-        image = Image.open(BytesIO(image_bytes))
-        return image.size  # Returns (width, height)
+        with Image.open(BytesIO(image_bytes)) as image:
+            return image.size  # Returns (width, height)
     except Exception as e:
         raise ValueError(f"Failed to decode image: {e}")
 
@@ -57,8 +120,7 @@ def resize_image_long_side(
         ValueError: If image cannot be decoded or resized
     """
     try:
-        image = Image.open(BytesIO(image_bytes))
-        original_width, original_height = image.size
+        original_width, original_height = get_image_dimensions(image_bytes)
         original_long_side = max(original_width, original_height)
 
         # If image is already smaller or equal, return original
@@ -73,8 +135,9 @@ def resize_image_long_side(
             new_height = long_side_px
             new_width = int(original_width * (long_side_px / original_height))
 
-        # Resize image
-        resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Resize image (the source decoder is closed as soon as the resized copy exists)
+        with Image.open(BytesIO(image_bytes)) as image:
+            resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
         # Convert to RGB if needed (for JPEG)
         if format == "JPEG" and resized_image.mode in ("RGBA", "LA", "P"):
@@ -3,7 +3,10 @@ Logging utilities for structured logging, service call tracking, and method trac
 """
 import functools
 import logging
+import random
 import time
+from contextvars import ContextVar
+from logging.handlers import MemoryHandler
 from typing import Any, Callable, Optional, TypeVar
 
 from app.config import settings
@@ -12,6 +15,97 @@ logger = logging.getLogger("media_promo_localizer")
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Request ID of the HTTP request being handled (set by the request logging middleware).
+# Tasks spawned while handling a request (e.g. job processing) inherit it.
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler with a large write buffer that does not flush after every record.
+
+    Flushing is left to the owner (see BatchMemoryHandler), so a batch of records
+    reaches the file in as few write() calls as possible.
+    """
+
+    def __init__(self, filename: str, buffer_size: int = 65536):
+        self.buffer_size = buffer_size
+        super().__init__(filename)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchMemoryHandler(MemoryHandler):
+    """MemoryHandler that flushes its target once after handing it each batch."""
+
+    def flush(self) -> None:
+        with self.lock:
+            super().flush()
+            if self.target:
+                self.target.flush()
+
+
+def format_correlation(request_id: Optional[str] = None, job_id: Optional[str] = None) -> str:
+    """
+    Build the correlation fragment used in ServiceCall/ServiceResponse log lines.
+
+    Args:
+        request_id: Request correlation ID (defaults to the current request's ID)
+        job_id: Job correlation ID
+
+    Returns:
+        "request=<id> job=<id>", either half alone, or "" when neither is set
+    """
+    if request_id is None:
+        request_id = request_id_var.get()
+    return _build_correlation(request_id, job_id)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_correlation(request_id: Optional[str], job_id: Optional[str]) -> str:
+    """Build (and memoize) the correlation fragment for a request/job pair."""
+    if request_id:
+        if job_id:
+            return f"request={request_id} job={job_id}"
+        return f"request={request_id}"
+    if job_id:
+        return f"job={job_id}"
+    return ""
+
+
+def should_sample_telemetry(rate: Optional[float] = None) -> bool:
+    """
+    Decide whether a high-frequency telemetry event should be logged.
+
+    Intended for routine success-path events only; errors should always be logged.
+
+    Args:
+        rate: Sampling rate in [0.0, 1.0] (defaults to TELEMETRY_SAMPLE_RATE)
+
+    Returns:
+        True if the event should be logged
+    """
+    if rate is None:
+        rate = settings.TELEMETRY_SAMPLE_RATE
+    if rate >= 1.0:
+        return True
+    return random.random() < rate
+
 
 def trace_calls(func: F) -> F:
     """
@@ -132,17 +226,17 @@ async def log_service_call(
         Tuple of (result, status_code, duration_ms)
     """
     outbound_timestamp = time.time()
-    correlation = []
-    if request_id:
-        correlation.append(f"request={request_id}")
-    if job_id:
-        correlation.append(f"job={job_id}")
-    correlation_str = " ".join(correlation) if correlation else ""
+    correlation_str = format_correlation(request_id, job_id)
 
     logger.info(
-        f"ServiceCall {correlation_str} service={service_name} endpoint={endpoint} "
-        f"method={method} outbound_timestamp={outbound_timestamp:.3f} "
-        f"payloadSizeBytes={payload_size_bytes or 0}"
+        "ServiceCall %s service=%s endpoint=%s method=%s outbound_timestamp=%.3f "
+        "payloadSizeBytes=%d",
+        correlation_str,
+        service_name,
+        endpoint,
+        method,
+        outbound_timestamp,
+        payload_size_bytes or 0,
     )
 
     call_start = time.perf_counter()
@@ -156,9 +250,14 @@ async def log_service_call(
         response_size = len(result) if isinstance(result, bytes) else 0
 
         logger.info(
-            f"ServiceResponse {correlation_str} service={service_name} status={status_code} "
-            f"response_timestamp={response_timestamp:.3f} durationMs={call_duration_ms} "
-            f"responseSizeBytes={response_size}"
+            "ServiceResponse %s service=%s status=%d response_timestamp=%.3f durationMs=%d "
+            "responseSizeBytes=%d",
+            correlation_str,
+            service_name,
+            status_code,
+            response_timestamp,
+            call_duration_ms,
+            response_size,
         )
 
         return result, status_code, call_duration_ms
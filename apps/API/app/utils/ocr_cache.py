@@ -0,0 +1,65 @@
+"""
+In-memory cache for OCR results keyed by image content.
+
+Jobs that reprocess the same asset (retries, runs for several target locales)
+send identical bytes to the OCR provider. Results are keyed by a BLAKE2b digest
+of the image so repeat requests skip the provider call entirely.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+from app.clients.interfaces import OcrResult
+from app.config import settings
+
+
+def ocr_cache_key(image_bytes: bytes) -> bytes:
+    """
+    Compute the content-addressed cache key for an image.
+
+    Args:
+        image_bytes: Image file bytes
+
+    Returns:
+        16-byte BLAKE2b digest of the image bytes
+    """
+    return hashlib.blake2b(image_bytes, digest_size=16).digest()
+
+
+class OcrResultCache(OrderedDict):
+    """Bounded LRU mapping of image digest -> OcrResult."""
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize OCR result cache.
+
+        Args:
+            max_entries: Maximum number of results kept before evicting the least recently used
+        """
+        super().__init__()
+        self.max_entries = max_entries
+
+    def __getitem__(self, key: bytes) -> OcrResult:
+        """Get a cached result and mark it as most recently used."""
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: bytes, value: OcrResult) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.max_entries:
+            self.popitem(last=False)
+
+
+# Global singleton instance
+_ocr_result_cache: Optional[OcrResultCache] = None
+
+
+def get_ocr_result_cache() -> OcrResultCache:
+    """Get the global OCR result cache instance."""
+    global _ocr_result_cache
+    if _ocr_result_cache is None:
+        _ocr_result_cache = OcrResultCache(max_entries=settings.OCR_RESULT_CACHE_SIZE)
+    return _ocr_result_cache
@@ -0,0 +1,65 @@
+"""
+Tests for image derivative utilities.
+"""
+import io
+
+import pytest
+from PIL import Image
+
+from app.utils.image_derivatives import get_image_dimensions, resize_image_long_side
+
+
+def _encode_image(width: int, height: int, format: str, **save_kwargs) -> bytes:
+    """Encode a blank RGB image of the given size."""
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 10, 10)).save(output, format=format, **save_kwargs)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize(
+    "format,save_kwargs",
+    [
+        ("PNG", {}),
+        ("JPEG", {}),
+        ("JPEG", {"progressive": True}),
+        ("GIF", {}),  # Not header-parsed; falls back to PIL
+    ],
+)
+def test_get_image_dimensions_matches_pil(format, save_kwargs):
+    """Test that header-derived dimensions match what PIL reports."""
+    image_bytes = _encode_image(123, 45, format, **save_kwargs)
+    assert get_image_dimensions(image_bytes) == (123, 45)
+
+
+def test_get_image_dimensions_does_not_decode_png(monkeypatch):
+    """Test that PNG dimensions are read without opening the image in PIL."""
+    image_bytes = _encode_image(640, 480, "PNG")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("PIL should not be used for PNG headers")
+
+    monkeypatch.setattr("app.utils.image_derivatives.Image.open", _fail)
+    assert get_image_dimensions(image_bytes) == (640, 480)
+
+
+def test_get_image_dimensions_invalid_bytes():
+    """Test that undecodable bytes raise ValueError."""
+    with pytest.raises(ValueError):
+        get_image_dimensions(b"fake image data")
+
+
+def test_resize_image_long_side_skips_decode_when_small_enough(monkeypatch):
+    """Test that an image already within the target size is returned without decoding."""
+    image_bytes = _encode_image(300, 200, "PNG")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("PIL should not be used when no resize is needed")
+
+    monkeypatch.setattr("app.utils.image_derivatives.Image.open", _fail)
+    assert resize_image_long_side(image_bytes, 300) is image_bytes
+
+
+def test_resize_image_long_side_preserves_aspect_ratio():
+    """Test that resizing scales the long side to the target."""
+    resized = resize_image_long_side(_encode_image(400, 200, "PNG"), 100)
+    assert get_image_dimensions(resized) == (100, 50)
@@ -0,0 +1,57 @@
+"""
+Tests for inpainting client implementations.
+"""
+import logging
+
+import pytest
+
+from app.clients.inpainting_client import StubInpaintingClient
+from app.models.jobs import DetectedText
+
+
+@pytest.fixture
+def sample_regions():
+    """Sample text regions for testing."""
+    return [DetectedText(text="COMING SOON", boundingBox=[0.12, 0.9, 0.78, 0.95], role="tagline")]
+
+
+@pytest.mark.asyncio
+async def test_stub_inpainting_returns_original_image(sample_regions, caplog):
+    """Test that the stub returns the input bytes and logs a full call/response pair."""
+    client = StubInpaintingClient()
+
+    with caplog.at_level(logging.INFO, logger="media_promo_localizer"):
+        result = await client.inpaint_regions(b"image", sample_regions, job_id="job_1")
+
+    assert result == b"image"
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(m.startswith("ServiceCall job=job_1 service=INPAINTING") for m in messages)
+    assert any(m.startswith("ServiceResponse job=job_1 service=INPAINTING") for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_stub_inpainting_telemetry_sampled_out(sample_regions, caplog, monkeypatch):
+    """Test that no telemetry is logged when the sample rate is zero."""
+    monkeypatch.setattr("app.utils.logging.settings.TELEMETRY_SAMPLE_RATE", 0.0)
+    client = StubInpaintingClient()
+
+    with caplog.at_level(logging.INFO, logger="media_promo_localizer"):
+        result = await client.inpaint_regions(b"image", sample_regions, job_id="job_1")
+
+    assert result == b"image"
+    assert not [r for r in caplog.records if "service=INPAINTING" in r.getMessage()]
+
+
+@pytest.mark.asyncio
+async def test_stub_inpainting_passes_bytes_through_without_copy(sample_regions):
+    """Test that bytes input is returned as the same object and buffers come back as bytes."""
+    client = StubInpaintingClient()
+    image_bytes = b"\x89PNG" * 1024
+
+    assert await client.inpaint_regions(image_bytes, sample_regions) is image_bytes
+
+    buffer = bytearray(b"image")
+    result = await client.inpaint_regions(buffer, sample_regions)
+    buffer[0:1] = b"X"
+    assert result == b"image"
+    assert isinstance(result, bytes)
@@ -0,0 +1,31 @@
+"""
+Tests for the in-memory job store.
+"""
+from datetime import timedelta
+
+from app.services.job_store import JobStore
+
+
+def test_job_store_evicts_oldest_job_at_capacity():
+    """Test that creating a job at capacity evicts the oldest job first."""
+    store = JobStore(max_jobs=2, ttl_seconds=3600)
+    store.create_job(job_id="loc_1", target_language="fr-FR")
+    store.create_job(job_id="loc_2", target_language="fr-FR")
+    store.create_job(job_id="loc_3", target_language="fr-FR")
+
+    assert store.get_job("loc_1") is None
+    assert store.get_job("loc_2") is not None
+    assert store.get_job("loc_3") is not None
+
+
+def test_job_store_evicts_expired_jobs_before_live_ones():
+    """Test that expired jobs are evicted without touching jobs still within TTL."""
+    store = JobStore(max_jobs=3, ttl_seconds=60)
+    for job_id in ("loc_1", "loc_2", "loc_3"):
+        store.create_job(job_id=job_id, target_language="fr-FR")
+    for job_id in ("loc_1", "loc_2"):
+        store._jobs[job_id].createdAt -= timedelta(seconds=120)
+
+    store.create_job(job_id="loc_4", target_language="fr-FR")
+
+    assert list(store._jobs) == ["loc_3", "loc_4"]
@@ -1,6 +1,7 @@
 """
 Tests for localization job endpoints.
 """
+import os
 import time
 
 import pytest
@@ -216,3 +217,85 @@ def test_job_get_returns_created_job(client, sample_image_jpeg):
 
 
 
+
+
+def test_job_to_get_response_reuses_nested_models():
+    """Test that the GET response shares the job's already-validated nested models."""
+    from datetime import datetime, timezone
+
+    from app.models.jobs import JobStatus, LocalizationJob, Progress, ProgressStage
+
+    now = datetime.now(timezone.utc)
+    job = LocalizationJob(
+        jobId="loc_test",
+        status=JobStatus.PROCESSING,
+        createdAt=now,
+        updatedAt=now,
+        targetLanguage="fr-FR",
+        progress=Progress(stage=ProgressStage.OCR, percent=10),
+    )
+
+    response = job.to_get_response()
+
+    assert response.progress is job.progress
+    assert response.model_dump(mode="json")["status"] == "processing"
+
+
+def test_create_job_rejects_oversized_file(client, sample_image_jpeg, monkeypatch):
+    """Test that uploads larger than MAX_UPLOAD_MB are rejected with 413."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "MAX_UPLOAD_MB", 0)
+    response = client.post(
+        "/v1/localization-jobs",
+        files={"file": ("poster.jpg", sample_image_jpeg, "image/jpeg")},
+        data={"targetLanguage": "es-MX"},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["error"]["code"] == "PAYLOAD_TOO_LARGE"
+
+
+@pytest.mark.parametrize("max_memory", [1 << 20, 16], ids=["in_memory", "rolled_over"])
+def test_copy_upload_to_disk(tmp_path, monkeypatch, max_memory):
+    """Test that spooled uploads are copied whether held in memory or on disk."""
+    from tempfile import SpooledTemporaryFile
+
+    from app.routers.jobs import _copy_upload_to_disk
+
+    monkeypatch.setattr("app.routers.jobs.UPLOAD_SPOOL_MAX_BYTES", max_memory)
+    data = bytes(range(256)) * 64
+    with SpooledTemporaryFile(max_size=max_memory) as source:
+        source.write(data)
+        destination = tmp_path / "poster.png"
+
+        assert _copy_upload_to_disk(source, destination, len(data)) == len(data)
+        assert destination.read_bytes() == data
+        assert _copy_upload_to_disk(source, tmp_path / "too_big.png", len(data) - 1) is None
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile"), reason="os.sendfile not available")
+def test_copy_upload_to_disk_finishes_short_sendfile(tmp_path, monkeypatch):
+    """Test that a sendfile that stops early is completed instead of truncating the upload."""
+    from tempfile import SpooledTemporaryFile
+
+    from app.routers.jobs import _copy_upload_to_disk
+
+    real_sendfile = os.sendfile
+    calls = []
+
+    def _short_sendfile(out_fd, in_fd, offset, count):
+        calls.append(offset)
+        return real_sendfile(out_fd, in_fd, offset, min(count, 1000)) if len(calls) == 1 else 0
+
+    monkeypatch.setattr("app.routers.jobs.UPLOAD_SPOOL_MAX_BYTES", 16)
+    monkeypatch.setattr(os, "sendfile", _short_sendfile)
+    data = bytes(range(256)) * 64
+    with SpooledTemporaryFile(max_size=16) as source:
+        source.write(data)
+        destination = tmp_path / "poster.png"
+
+        assert _copy_upload_to_disk(source, destination, len(data)) == len(data)
+
+    assert calls == [0, 1000]
+    assert destination.read_bytes() == data
@@ -1,13 +1,15 @@
 """
 Tests for live localization engine.
 """
+import asyncio
+
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.clients.inpainting_client import StubInpaintingClient
-from app.clients.interfaces import OcrResult, TranslatedRegion
+from app.clients.interfaces import OcrResult, OcrTimeout, TranslatedRegion
 from app.clients.ocr_client import CloudOcrClient
 from app.clients.translation_client import LlmTranslationClient
 from app.models.jobs import DetectedText, JobStatus, LocalizationJob
@@ -121,6 +123,50 @@ async def test_live_engine_success(
     mock_translation_client.translate_text_regions.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_live_engine_inpaints_while_translating(
+    mock_ocr_client, mock_translation_client, sample_job
+):
+    """Test that inpainting starts without waiting for the translation response."""
+    inpainting_client = MagicMock(spec=StubInpaintingClient)
+    inpainting_client.inpaint_regions = AsyncMock(return_value=b"inpainted")
+    translated = mock_translation_client.translate_text_regions.return_value
+
+    async def _translate(*args, **kwargs):
+        await asyncio.sleep(0)
+        inpainting_client.inpaint_regions.assert_awaited_once()
+        return translated
+
+    mock_translation_client.translate_text_regions = AsyncMock(side_effect=_translate)
+    engine = LiveLocalizationEngine(
+        ocr_client=mock_ocr_client,
+        translation_client=mock_translation_client,
+        inpainting_client=inpainting_client,
+    )
+
+    result_job = await engine.run(sample_job)
+
+    assert result_job.status == JobStatus.SUCCEEDED
+    assert result_job.progress.stageTimingsMs.inpaint > 0
+
+
+@pytest.mark.asyncio
+async def test_live_engine_writes_output_copy_of_upload(
+    mock_ocr_client, mock_translation_client, mock_inpainting_client, sample_job, tmp_path
+):
+    """Test that packaging writes output.png as a copy of the uploaded poster."""
+    engine = LiveLocalizationEngine(
+        ocr_client=mock_ocr_client,
+        translation_client=mock_translation_client,
+        inpainting_client=mock_inpainting_client,
+    )
+
+    result_job = await engine.run(sample_job)
+
+    assert result_job.status == JobStatus.SUCCEEDED
+    assert (tmp_path / "output.png").read_bytes() == b"fake image data"
+
+
 @pytest.mark.asyncio
 async def test_live_engine_ocr_failure(
     mock_translation_client, mock_inpainting_client, sample_job
@@ -143,6 +189,27 @@ async def test_live_engine_ocr_failure(
     assert result_job.result is None
 
 
+@pytest.mark.asyncio
+async def test_live_engine_ocr_timeout(
+    mock_translation_client, mock_inpainting_client, sample_job
+):
+    """Test live engine reports OCR timeouts with the timeout error code."""
+    mock_ocr_client = MagicMock(spec=CloudOcrClient)
+    mock_ocr_client.recognize_text = AsyncMock(side_effect=OcrTimeout("OCR service timeout"))
+
+    engine = LiveLocalizationEngine(
+        ocr_client=mock_ocr_client,
+        translation_client=mock_translation_client,
+        inpainting_client=mock_inpainting_client,
+    )
+
+    result_job = await engine.run(sample_job)
+
+    assert result_job.status == JobStatus.FAILED
+    assert result_job.error.code == "OCR_MODEL_TIMEOUT"
+    assert result_job.error.retryable is True
+
+
 @pytest.mark.asyncio
 async def test_live_engine_translation_failure(
     mock_ocr_client, mock_inpainting_client, sample_job
@@ -167,6 +234,38 @@ async def test_live_engine_translation_failure(
     assert result_job.result is None
 
 
+@pytest.mark.asyncio
+async def test_live_engine_credits_failure_cancels_inpainting(
+    mock_ocr_client, mock_translation_client, sample_job
+):
+    """Test that a failure after translation cancels the in-flight inpainting task."""
+    inpaint_cancelled = asyncio.Event()
+
+    async def _inpaint(*args, **kwargs):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            inpaint_cancelled.set()
+            raise
+
+    inpainting_client = MagicMock(spec=StubInpaintingClient)
+    inpainting_client.inpaint_regions = AsyncMock(side_effect=_inpaint)
+    engine = LiveLocalizationEngine(
+        ocr_client=mock_ocr_client,
+        translation_client=mock_translation_client,
+        inpainting_client=inpainting_client,
+    )
+
+    with patch.object(
+        engine, "_detect_credits", AsyncMock(side_effect=RuntimeError("credits failed"))
+    ):
+        result_job = await engine.run(sample_job)
+
+    assert result_job.status == JobStatus.FAILED
+    assert result_job.error.code == "INTERNAL_ERROR"
+    await asyncio.wait_for(inpaint_cancelled.wait(), timeout=1)
+
+
 @pytest.mark.asyncio
 async def test_live_engine_classify_text_regions(mock_ocr_client, mock_translation_client, mock_inpainting_client):
     """Test text region classification."""
@@ -189,6 +288,26 @@ async def test_live_engine_classify_text_regions(mock_ocr_client, mock_translati
     assert classified[2].role == "other"  # URL stays locked
 
 
+@pytest.mark.asyncio
+async def test_live_engine_classify_preserves_geometry(mock_ocr_client, mock_translation_client, mock_inpainting_client):
+    """Test that OCR geometry survives classification and stays out of the API schema."""
+    engine = LiveLocalizationEngine(
+        ocr_client=mock_ocr_client,
+        translation_client=mock_translation_client,
+        inpainting_client=mock_inpainting_client,
+    )
+    region = DetectedText(text="COMING SOON", boundingBox=[0.1, 0.2, 0.8, 0.28], role="other")
+    geometry = {"quad_norm": [], "center_norm": {"x": 0.45, "y": 0.24}, "angle_deg": 3.0}
+    region._geometry = geometry
+
+    classified = engine._classify_text_regions([region])
+
+    assert classified[0].role == "tagline"
+    assert classified[0]._geometry == geometry
+    assert "_geometry" not in classified[0].model_dump()
+    assert DetectedText(text="x", boundingBox=[0, 0, 1, 1], role="other")._geometry is None
+
+
 @pytest.mark.asyncio
 async def test_live_engine_is_localizable(mock_ocr_client, mock_translation_client, mock_inpainting_client):
     """Test localizability policy."""
@@ -278,8 +397,8 @@ async def test_live_engine_translation_failure_shows_translation_stage(
     assert result_job.progress.stage == ProgressStage.TRANSLATION
     assert result_job.progress.percent == 50  # Should be 50% when in translation stage
     # Should have OCR timing (completed) and translation timing (failed but attempted)
-    assert "ocr" in result_job.progress.stageTimingsMs
-    assert "translation" in result_job.progress.stageTimingsMs
+    assert result_job.progress.stageTimingsMs.ocr >= 0
+    assert result_job.progress.stageTimingsMs.translation >= 0
 
 
 @pytest.mark.asyncio
@@ -351,3 +470,62 @@ async def test_live_engine_skip_ocr(
     # Verify job has valid result (empty detected text when OCR is skipped)
     assert result_job.result.detectedText is not None
     assert len(result_job.result.detectedText) == 0  # Empty list when OCR is skipped
+
+
+def test_create_live_engine_reuses_engine_per_config():
+    """Test that the engine factory returns one cached engine per configuration."""
+    from app.services.live_engine import create_live_engine
+
+    create_live_engine.cache_clear()
+    try:
+        engine = create_live_engine("ocr-key", None, "openai-key", "gpt-4o-mini")
+        assert create_live_engine("ocr-key", None, "openai-key", "gpt-4o-mini") is engine
+        assert create_live_engine("ocr-key", None, "openai-key", "gpt-4o") is not engine
+    finally:
+        create_live_engine.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_cached_live_engine_retains_no_job_images(
+    mock_ocr_client, mock_translation_client, tmp_path, monkeypatch
+):
+    """Test that a cached engine keeps no image derivatives once its jobs finish."""
+    import io
+
+    from PIL import Image
+
+    from app.config import settings
+    from app.services.live_engine import create_live_engine
+
+    monkeypatch.setattr(settings, "OCR_IMAGE_LONG_SIDE_PX", 32)
+    monkeypatch.setattr(settings, "INPAINT_IMAGE_LONG_SIDE_PX", 32)
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), (200, 10, 10)).save(buffer, format="PNG")
+
+    create_live_engine.cache_clear()
+    try:
+        engine = create_live_engine("ocr-key", None, "openai-key", "gpt-4o-mini")
+        engine.ocr_client = mock_ocr_client
+        engine.translation_client = mock_translation_client
+
+        for job_id in ("loc_first", "loc_second"):
+            image_file = tmp_path / f"{job_id}.png"
+            image_file.write_bytes(buffer.getvalue())
+            now = datetime.now(timezone.utc)
+            job = LocalizationJob(
+                jobId=job_id,
+                status=JobStatus.QUEUED,
+                createdAt=now,
+                updatedAt=now,
+                targetLanguage="fr-FR",
+                filePath=str(image_file),
+            )
+
+            result_job = await create_live_engine(
+                "ocr-key", None, "openai-key", "gpt-4o-mini"
+            ).run(job)
+
+            assert result_job.status == JobStatus.SUCCEEDED
+            assert engine._derivative_cache == {}
+    finally:
+        create_live_engine.cache_clear()
@@ -0,0 +1,25 @@
+"""
+Tests for logging utilities.
+"""
+import logging
+
+from app.utils.logging import BatchMemoryHandler, BufferedFileHandler
+
+
+def test_buffered_file_handler_writes_on_batch_flush(tmp_path):
+    """Test that buffered records reach the log file when the batch is flushed."""
+    log_file = tmp_path / "app.log"
+    file_handler = BufferedFileHandler(str(log_file))
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    buffer_handler = BatchMemoryHandler(capacity=10, flushLevel=logging.ERROR, target=file_handler)
+
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "first", None, None)
+    buffer_handler.handle(record)
+    file_handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, "direct", None, None))
+    assert log_file.read_text() == ""
+
+    buffer_handler.flush()
+    assert log_file.read_text() == "direct\nfirst\n"
+
+    buffer_handler.close()
+    file_handler.close()
@@ -1,20 +1,23 @@
 """
 Tests for OCR client implementations.
 """
+import json
 import logging
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.clients.interfaces import OcrResult
-from app.clients.ocr_client import CloudOcrClient
+from app.clients.interfaces import OcrError, OcrHttpError, OcrResult, OcrTimeout
+from app.clients.ocr_client import RESPONSE_FIELDS, CloudOcrClient
 from app.models.jobs import DetectedText
+from app.utils.ocr_cache import OcrResultCache
 
 
 @pytest.fixture
 def mock_httpx_response():
     """Mock httpx response for OCR API."""
     response = MagicMock()
-    response.json.return_value = {
+    payload = {
         "responses": [
             {
                 "textAnnotations": [
@@ -55,10 +58,19 @@ def mock_httpx_response():
             }
         ]
     }
+    response.content = json.dumps(payload).encode("utf-8")
     response.raise_for_status = MagicMock()
     return response
 
 
+@pytest.fixture
+def mock_http_client(mock_httpx_response):
+    """Mock shared httpx.AsyncClient returning the OCR API response."""
+    http_client = MagicMock()
+    http_client.post = AsyncMock(return_value=mock_httpx_response)
+    return http_client
+
+
 @pytest.fixture
 def sample_image_bytes():
     """Sample image bytes for testing."""
@@ -67,25 +79,138 @@ def sample_image_bytes():
 
 
 @pytest.mark.asyncio
-async def test_cloud_ocr_client_success(mock_httpx_response, sample_image_bytes):
+async def test_cloud_ocr_client_success(mock_http_client, sample_image_bytes):
     """Test successful OCR recognition."""
-    with patch("app.clients.ocr_client.httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_httpx_response
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+
+        client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+        result = await client.recognize_text(sample_image_bytes)
+
+        assert isinstance(result, OcrResult)
+        assert result.image_width == 100
+        assert result.image_height == 50
+        assert len(result.text_regions) == 2  # Excluding full text annotation
+        assert all(isinstance(r, DetectedText) for r in result.text_regions)
+
+
+@pytest.mark.asyncio
+async def test_cloud_ocr_client_reuses_http_client(mock_http_client, sample_image_bytes):
+    """Test that consecutive OCR calls share one HTTP client (no per-call client)."""
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+
+        with patch("app.clients.ocr_client.httpx.AsyncClient") as mock_client_cls:
+            client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+            await client.recognize_text(sample_image_bytes)
+            await client.recognize_text(sample_image_bytes)
+
+            mock_client_cls.assert_not_called()
+        assert mock_http_client.post.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cloud_ocr_client_posts_prebuilt_json_body(mock_http_client, sample_image_bytes):
+    """Test that the request body is sent as pre-serialized JSON bytes."""
+    import base64
+
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+
+        client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+        await client.recognize_text(sample_image_bytes)
+
+    call_kwargs = mock_http_client.post.call_args.kwargs
+    assert "json" not in call_kwargs
+    assert call_kwargs["headers"]["Content-Type"] == "application/json"
+    body = json.loads(call_kwargs["content"])
+    request = body["requests"][0]
+    assert base64.b64decode(request["image"]["content"]) == sample_image_bytes
+    assert request["features"] == [{"type": "DOCUMENT_TEXT_DETECTION"}]
+
+
+def test_encode_annotate_request_matches_json_serialization():
+    """Test that the templated request body is the same JSON a serializer would produce."""
+    import base64
+
+    from app.clients.ocr_client import _encode_annotate_request
+
+    images = [b"\xff\xd8first", b"\x89PNGsecond\x00\xff"]
+    expected = {
+        "requests": [
+            {
+                "image": {"content": base64.b64encode(image).decode("ascii")},
+                "features": [{"type": "DOCUMENT_TEXT_DETECTION"}],
+            }
+            for image in images
+        ]
+    }
+
+    assert json.loads(_encode_annotate_request(images)) == expected
+
+
+@pytest.mark.asyncio
+async def test_cloud_ocr_client_posts_to_prebuilt_url(mock_http_client, sample_image_bytes):
+    """Test that the request URL (with API key) is built once and reused."""
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+
+        client = CloudOcrClient(
+            api_key="test-key",
+            api_endpoint="https://vision.example.com/v1/images:annotate",
+            http_client=mock_http_client,
+        )
+        await client.recognize_text(sample_image_bytes)
+        await client.recognize_text(sample_image_bytes)
+
+    first_url, second_url = (call.args[0] for call in mock_http_client.post.call_args_list)
+    assert first_url is second_url
+    assert first_url.copy_with(query=None) == "https://vision.example.com/v1/images:annotate"
+    assert first_url.params["key"] == "test-key"
+    assert first_url.params["fields"] == RESPONSE_FIELDS
+
+
+@pytest.mark.asyncio
+async def test_cloud_ocr_client_batch_packs_16_images_per_call(mock_http_client, sample_image_bytes):
+    """Test that batch OCR sends at most 16 images per call and keeps input order."""
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+
+        client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+        results = await client.recognize_text_batch([sample_image_bytes] * 17)
+
+    assert mock_http_client.post.await_count == 2
+    request_counts = [
+        len(json.loads(call.kwargs["content"])["requests"])
+        for call in mock_http_client.post.call_args_list
+    ]
+    assert request_counts == [16, 1]
+    assert len(results) == 17
+    # The mocked API returns one response per call; it maps to the first image of each batch
+    assert len(results[0].text_regions) == 2
+    assert results[1].text_regions == []
+    assert len(results[16].text_regions) == 2
+
+
+@pytest.mark.asyncio
+async def test_cloud_ocr_client_cache_skips_repeat_calls(mock_http_client, sample_image_bytes):
+    """Test that identical image bytes are served from the result cache."""
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+
+        client = CloudOcrClient(
+            api_key="test-key", http_client=mock_http_client, cache=OcrResultCache(max_entries=4)
         )
-        with patch("app.clients.ocr_client.Image.open") as mock_image:
-            mock_img = MagicMock()
-            mock_img.size = (100, 50)
-            mock_image.return_value = mock_img
+        first = await client.recognize_text(sample_image_bytes)
+        second = await client.recognize_text(sample_image_bytes)
 
-            client = CloudOcrClient(api_key="test-key")
-            result = await client.recognize_text(sample_image_bytes)
+    assert mock_http_client.post.await_count == 1
+    assert second is first
 
-            assert isinstance(result, OcrResult)
-            assert result.image_width == 100
-            assert result.image_height == 50
-            assert len(result.text_regions) == 2  # Excluding full text annotation
-            assert all(isinstance(r, DetectedText) for r in result.text_regions)
+
+def test_ocr_result_cache_evicts_least_recently_used():
+    """Test that the OCR result cache stays bounded and evicts the oldest entry."""
+    cache = OcrResultCache(max_entries=2)
+    cache[b"a"] = OcrResult([], 1, 1)
+    cache[b"b"] = OcrResult([], 1, 1)
+    cache[b"a"]  # Touch "a" so "b" becomes least recently used
+    cache[b"c"] = OcrResult([], 1, 1)
+
+    assert list(cache) == [b"a", b"c"]
 
 
 @pytest.mark.asyncio
@@ -93,27 +218,24 @@ async def test_cloud_ocr_client_api_error(sample_image_bytes):
     """Test OCR client handles API errors."""
     import httpx
 
-    with patch("app.clients.ocr_client.httpx.AsyncClient") as mock_client:
-        mock_post = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        mock_post.return_value = mock_response
-        mock_post.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Bad Request", request=MagicMock(), response=mock_response
-        )
+    mock_response = MagicMock()
+    mock_response.status_code = 400
+    mock_response.text = "Bad Request"
+    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "Bad Request", request=MagicMock(), response=mock_response
+    )
+    mock_http_client = MagicMock()
+    mock_http_client.post = AsyncMock(return_value=mock_response)
 
-        mock_client.return_value.__aenter__.return_value.post = mock_post
-        with patch("app.clients.ocr_client.Image.open") as mock_image:
-            mock_img = MagicMock()
-            mock_img.size = (100, 50)
-            mock_image.return_value = mock_img
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
 
-            client = CloudOcrClient(api_key="test-key")
-            with pytest.raises(Exception) as exc_info:
-                await client.recognize_text(sample_image_bytes)
+        client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+        with pytest.raises(OcrHttpError) as exc_info:
+            await client.recognize_text(sample_image_bytes)
 
-            assert "OCR service returned error" in str(exc_info.value)
+        assert "OCR service returned error" in str(exc_info.value)
+        assert exc_info.value.status_code == 400
+        assert isinstance(exc_info.value.__cause__, httpx.HTTPStatusError)
 
 
 @pytest.mark.asyncio
@@ -121,21 +243,124 @@ async def test_cloud_ocr_client_timeout(sample_image_bytes):
     """Test OCR client handles timeout errors."""
     import httpx
 
-    with patch("app.clients.ocr_client.httpx.AsyncClient") as mock_client:
-        mock_post = AsyncMock()
-        mock_post.side_effect = httpx.TimeoutException("Request timeout")
+    mock_http_client = MagicMock()
+    mock_http_client.post = AsyncMock(side_effect=httpx.TimeoutException("Request timeout"))
+
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+
+        client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+        with pytest.raises(OcrTimeout) as exc_info:
+            await client.recognize_text(sample_image_bytes)
+
+        assert "OCR service timeout" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("image_bytes", [b"", b"\x00" * (20 * 1024 * 1024 + 1)])
+async def test_cloud_ocr_client_rejects_empty_or_oversized_image(mock_http_client, image_bytes):
+    """Test that images the API would reject fail before any request is made."""
+    client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+    with pytest.raises(OcrError):
+        await client.recognize_text(image_bytes)
+
+    mock_http_client.post.assert_not_called()
+
+
+def test_cloud_ocr_client_uses_normalized_vertices():
+    """Test that pre-normalized vertices give the same word box as pixel vertices."""
+    client = CloudOcrClient(api_key="test-key")
+    pixel_word = {
+        "symbols": [{"text": "HI"}],
+        "boundingBox": {
+            "vertices": [{"x": 10, "y": 10}, {"x": 90, "y": 10}, {"x": 90, "y": 30}, {"x": 10, "y": 30}]
+        },
+    }
+    normalized_word = {
+        "symbols": [{"text": "HI"}],
+        "boundingBox": {
+            "normalizedVertices": [
+                {"x": 0.1, "y": 0.2},
+                {"x": 0.9, "y": 0.2},
+                {"x": 0.9, "y": 0.6},
+                {"x": 0.1, "y": 0.6},
+            ]
+        },
+    }
+
+    from_pixels = client._extract_word_data(pixel_word, 100, 50)
+    from_normalized = client._extract_word_data(normalized_word, 100, 50)
+
+    assert from_normalized[0] == "HI"
+    assert from_normalized[1:6] == pytest.approx(from_pixels[1:6])
+
+
+def test_cloud_ocr_client_skips_text_annotations_without_text():
+    """Test that fallback annotations with blank descriptions produce no words."""
+    client = CloudOcrClient(api_key="test-key")
+    vertices = [{"x": 10, "y": 10}, {"x": 90, "y": 10}, {"x": 90, "y": 30}, {"x": 10, "y": 30}]
+    response = {
+        "textAnnotations": [
+            {"description": "HI", "boundingPoly": {"vertices": vertices}},
+            {"description": "  ", "boundingPoly": {"vertices": vertices}},
+            {"boundingPoly": {"vertices": vertices}},
+            {"description": "HI", "boundingPoly": {"vertices": vertices}},
+        ]
+    }
+
+    result = client._parse_annotate_response(response, 100, 50)
 
-        mock_client.return_value.__aenter__.return_value.post = mock_post
-        with patch("app.clients.ocr_client.Image.open") as mock_image:
-            mock_img = MagicMock()
-            mock_img.size = (100, 50)
-            mock_image.return_value = mock_img
+    assert [r.text for r in result.text_regions] == ["HI"]
 
-            client = CloudOcrClient(api_key="test-key")
-            with pytest.raises(Exception) as exc_info:
-                await client.recognize_text(sample_image_bytes)
 
-            assert "OCR service timeout" in str(exc_info.value)
+def test_cloud_ocr_client_groups_rotated_words_into_lines():
+    """Test that words on slightly rotated baselines are grouped into one region per line."""
+    import math
+
+    client = CloudOcrClient(api_key="test-key")
+    angle = math.radians(5)
+    words = []
+    for line_index, line_text in enumerate(["NOW PLAYING EVERYWHERE", "ONLY IN THEATERS"]):
+        for word_index, text in enumerate(line_text.split()):
+            # Place words along a baseline rotated 5 degrees, lines 100px apart
+            x = 100 + 200 * word_index
+            y = 300 + 100 * line_index + x * math.tan(angle)
+            vertices = [
+                {"x": x, "y": y},
+                {"x": x + 150, "y": y + 150 * math.tan(angle)},
+                {"x": x + 150, "y": y + 40 + 150 * math.tan(angle)},
+                {"x": x, "y": y + 40},
+            ]
+            words.append(client._extract_word_from_vertices(text, vertices, 1000, 1000))
+
+    regions = client._group_words_into_lines_rotation_aware(words)
+
+    assert [r.text for r in regions] == ["NOW PLAYING EVERYWHERE", "ONLY IN THEATERS"]
+
+
+def test_cloud_ocr_client_groups_axis_aligned_words_without_rotation(monkeypatch):
+    """Test that horizontal text is grouped into lines without running the rotation."""
+    client = CloudOcrClient(api_key="test-key")
+    words = []
+    for line_index, line_text in enumerate(["COMING SOON", "TO THEATERS"]):
+        for word_index, text in enumerate(line_text.split()):
+            x = 100 + 200 * word_index
+            y = 300 + 100 * line_index
+            vertices = [
+                {"x": x, "y": y},
+                {"x": x + 150, "y": y},
+                {"x": x + 150, "y": y + 40},
+                {"x": x, "y": y + 40},
+            ]
+            words.append(client._extract_word_from_vertices(text, vertices, 1000, 1000))
+
+    def _fail(*args):
+        raise AssertionError("axis-aligned paragraphs should not be rotated")
+
+    monkeypatch.setattr("app.clients.ocr_client.cos", _fail)
+    regions = client._group_words_into_lines_rotation_aware(words)
+
+    assert [r.text for r in regions] == ["COMING SOON", "TO THEATERS"]
+    assert regions[0]._geometry["angle_deg"] == 0.0
 
 
 def test_cloud_ocr_client_missing_api_key():
@@ -146,50 +371,61 @@ def test_cloud_ocr_client_missing_api_key():
 
 
 @pytest.mark.asyncio
-async def test_cloud_ocr_client_logs_job_id(mock_httpx_response, sample_image_bytes):
+async def test_cloud_ocr_client_logs_job_id(mock_http_client, sample_image_bytes):
     """Test that OCR client includes job_id in ServiceCall logs when provided."""
-    with patch("app.clients.ocr_client.httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_httpx_response
-        )
-        with patch("app.clients.ocr_client.Image.open") as mock_image:
-            mock_img = MagicMock()
-            mock_img.size = (100, 50)
-            mock_image.return_value = mock_img
-
-            # Capture log messages
-            log_messages = []
-            handler = logging.Handler()
-            handler.emit = lambda record: log_messages.append(record.getMessage())
-            logger = logging.getLogger("media_promo_localizer")
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-
-            try:
-                client = CloudOcrClient(api_key="test-key")
-                test_job_id = "test-job-123"
-                await client.recognize_text(sample_image_bytes, job_id=test_job_id)
-
-                # Verify ServiceCall log contains job_id
-                service_call_logs = [
-                    msg for msg in log_messages if "ServiceCall" in msg and "OCR" in msg
-                ]
-                assert len(service_call_logs) > 0, "ServiceCall log should be emitted"
-                assert f"job={test_job_id}" in service_call_logs[0], (
-                    f"ServiceCall log should contain job={test_job_id}, "
-                    f"got: {service_call_logs[0]}"
-                )
-
-                # Verify ServiceResponse log also contains job_id
-                service_response_logs = [
-                    msg
-                    for msg in log_messages
-                    if "ServiceResponse" in msg and "OCR" in msg
-                ]
-                assert len(service_response_logs) > 0, "ServiceResponse log should be emitted"
-                assert f"job={test_job_id}" in service_response_logs[0], (
-                    f"ServiceResponse log should contain job={test_job_id}, "
-                    f"got: {service_response_logs[0]}"
-                )
-            finally:
-                logger.removeHandler(handler)
+    with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+
+        # Capture log messages
+        log_messages = []
+        handler = logging.Handler()
+        handler.emit = lambda record: log_messages.append(record.getMessage())
+        logger = logging.getLogger("media_promo_localizer")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+        try:
+            client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+            test_job_id = "test-job-123"
+            await client.recognize_text(sample_image_bytes, job_id=test_job_id)
+
+            # Verify ServiceCall log contains job_id
+            service_call_logs = [
+                msg for msg in log_messages if "ServiceCall" in msg and "OCR" in msg
+            ]
+            assert len(service_call_logs) > 0, "ServiceCall log should be emitted"
+            assert f"job={test_job_id}" in service_call_logs[0], (
+                f"ServiceCall log should contain job={test_job_id}, "
+                f"got: {service_call_logs[0]}"
+            )
+
+            # Verify ServiceResponse log also contains job_id
+            service_response_logs = [
+                msg
+                for msg in log_messages
+                if "ServiceResponse" in msg and "OCR" in msg
+            ]
+            assert len(service_response_logs) > 0, "ServiceResponse log should be emitted"
+            assert f"job={test_job_id}" in service_response_logs[0], (
+                f"ServiceResponse log should contain job={test_job_id}, "
+                f"got: {service_response_logs[0]}"
+            )
+        finally:
+            logger.removeHandler(handler)
+
+
+@pytest.mark.asyncio
+async def test_cloud_ocr_client_logs_request_id_from_context(mock_http_client, sample_image_bytes, caplog):
+    """Test that the current request ID is picked up without being passed explicitly."""
+    from app.utils.logging import request_id_var
+
+    token = request_id_var.set("req-abc")
+    try:
+        with patch("app.clients.ocr_client.get_image_dimensions", return_value=(100, 50)):
+            with caplog.at_level(logging.INFO, logger="media_promo_localizer"):
+                client = CloudOcrClient(api_key="test-key", http_client=mock_http_client)
+                await client.recognize_text(sample_image_bytes, job_id="job-1")
+    finally:
+        request_id_var.reset(token)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(m.startswith("ServiceCall request=req-abc job=job-1 service=OCR") for m in messages)
@@ -10,6 +10,14 @@ from app.clients.translation_client import LlmTranslationClient
 from app.models.jobs import DetectedText
 
 
+def _openai_response(payload) -> MagicMock:
+    """Build a mock chat completion whose message content is the given reply payload."""
+    content = payload if isinstance(payload, str) else json.dumps(payload)
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    return response
+
+
 @pytest.fixture
 def sample_regions():
     """Sample text regions for testing."""
@@ -22,72 +30,142 @@ def sample_regions():
 @pytest.fixture
 def mock_openai_response():
     """Mock OpenAI API response."""
-    response = MagicMock()
-    response.choices = [
-        MagicMock(
-            message=MagicMock(
-                content=json.dumps(
-                    {
-                        "translations": [
-                            {"originalText": "THE GREAT HEIST", "translatedText": "LE GRAND CASSE"},
-                            {"originalText": "COMING SOON", "translatedText": "BIENTÔT"},
-                        ]
-                    }
-                )
-            )
+    return _openai_response(
+        {
+            "translations": [
+                {"originalText": "THE GREAT HEIST", "translatedText": "LE GRAND CASSE"},
+                {"originalText": "COMING SOON", "translatedText": "BIENTÔT"},
+            ]
+        }
+    )
+
+
+@pytest.fixture
+def mock_openai(mock_openai_response):
+    """Patched AsyncOpenAI class whose client returns the mock OpenAI API response."""
+    with patch("app.clients.translation_client.AsyncOpenAI") as mock_openai:
+        mock_openai.return_value.chat.completions.create = AsyncMock(
+            return_value=mock_openai_response
         )
-    ]
-    return response
+        yield mock_openai
 
 
 @pytest.mark.asyncio
-async def test_llm_translation_client_success(sample_regions, mock_openai_response):
+async def test_llm_translation_client_success(sample_regions, mock_openai):
     """Test successful translation."""
-    with patch("app.clients.translation_client.AsyncOpenAI") as mock_openai:
-        mock_client = MagicMock()
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
-        mock_openai.return_value = mock_client
+    client = LlmTranslationClient(api_key="test-key")
+    result = await client.translate_text_regions(sample_regions, "fr-FR")
 
-        client = LlmTranslationClient(api_key="test-key")
-        result = await client.translate_text_regions(sample_regions, "fr-FR")
+    assert len(result) == 2
+    assert all(isinstance(r, TranslatedRegion) for r in result)
+    assert result[0].translated_text == "LE GRAND CASSE"
+    assert result[1].translated_text == "BIENTÔT"
 
-        assert len(result) == 2
-        assert all(isinstance(r, TranslatedRegion) for r in result)
-        assert result[0].translated_text == "LE GRAND CASSE"
-        assert result[1].translated_text == "BIENTÔT"
+
+@pytest.mark.asyncio
+async def test_llm_translation_client_reuses_openai_client(sample_regions, mock_openai):
+    """Test that one AsyncOpenAI instance on the shared HTTP client serves every call."""
+    from app.clients.http_client import get_http_client
+
+    client = LlmTranslationClient(api_key="test-key")
+    await client.translate_text_regions(sample_regions, "fr-FR")
+    await client.translate_text_regions(sample_regions, "de-DE")
+
+    mock_openai.assert_called_once()
+    assert mock_openai.call_args.kwargs["http_client"] is get_http_client()
+    assert mock_openai.return_value.chat.completions.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_translation_client_picks_up_recreated_http_client(sample_regions, mock_openai):
+    """Test that a closed shared HTTP client is not kept by an existing translation client."""
+    from app.clients.http_client import close_http_client, get_http_client
+
+    client = LlmTranslationClient(api_key="test-key")
+    await client.translate_text_regions(sample_regions, "fr-FR")
+    first_http_client = mock_openai.call_args.kwargs["http_client"]
+
+    await close_http_client()
+    await client.translate_text_regions(sample_regions, "fr-FR")
+
+    assert mock_openai.call_count == 2
+    assert first_http_client.is_closed
+    assert mock_openai.call_args.kwargs["http_client"] is get_http_client()
 
 
 @pytest.mark.asyncio
-async def test_llm_translation_client_api_error(sample_regions):
+async def test_llm_translation_client_uses_injected_http_client(sample_regions, mock_openai):
+    """Test that an injected HTTP client is used instead of the shared one."""
+    import httpx
+
+    http_client = httpx.AsyncClient()
+    client = LlmTranslationClient(api_key="test-key", http_client=http_client)
+    await client.translate_text_regions(sample_regions, "fr-FR")
+
+    assert mock_openai.call_args.kwargs["http_client"] is http_client
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_llm_translation_client_maps_reordered_translations(sample_regions, mock_openai):
+    """Test that translations returned out of order are matched back by original text."""
+    mock_openai.return_value.chat.completions.create.return_value = _openai_response(
+        {
+            "translations": [
+                {"originalText": "COMING SOON", "translatedText": "BIENTÔT"},
+                {"originalText": "THE GREAT HEIST", "translatedText": "LE GRAND CASSE"},
+            ]
+        }
+    )
+
+    client = LlmTranslationClient(api_key="test-key")
+    result = await client.translate_text_regions(sample_regions, "fr-FR")
+
+    assert [r.original_text for r in result] == ["THE GREAT HEIST", "COMING SOON"]
+    assert [r.translated_text for r in result] == ["LE GRAND CASSE", "BIENTÔT"]
+
+
+@pytest.mark.asyncio
+async def test_llm_translation_client_translates_repeated_text_once(mock_openai):
+    """Test that repeated region texts are sent once and mapped back to every region."""
+    regions = [
+        DetectedText(text="THE GREAT HEIST", boundingBox=[0.1, 0.2, 0.8, 0.28], role="title"),
+        DetectedText(text="COMING SOON", boundingBox=[0.12, 0.9, 0.78, 0.95], role="tagline"),
+        DetectedText(text="COMING SOON", boundingBox=[0.12, 0.5, 0.78, 0.55], role="tagline"),
+    ]
+
+    client = LlmTranslationClient(api_key="test-key")
+    result = await client.translate_text_regions(regions, "fr-FR")
+
+    create = mock_openai.return_value.chat.completions.create
+    prompt = create.call_args.kwargs["messages"][1]["content"]
+    assert prompt.count('"COMING SOON"') == 1
+    assert [r.translated_text for r in result] == ["LE GRAND CASSE", "BIENTÔT", "BIENTÔT"]
+    assert [r.bounding_box for r in result] == [r.boundingBox for r in regions]
+
+
+@pytest.mark.asyncio
+async def test_llm_translation_client_api_error(sample_regions, mock_openai):
     """Test translation client handles API errors."""
-    with patch("app.clients.translation_client.AsyncOpenAI") as mock_openai:
-        mock_client = MagicMock()
-        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
-        mock_openai.return_value = mock_client
+    mock_openai.return_value.chat.completions.create.side_effect = Exception("API Error")
 
-        client = LlmTranslationClient(api_key="test-key")
-        with pytest.raises(Exception) as exc_info:
-            await client.translate_text_regions(sample_regions, "fr-FR")
+    client = LlmTranslationClient(api_key="test-key")
+    with pytest.raises(Exception) as exc_info:
+        await client.translate_text_regions(sample_regions, "fr-FR")
 
-        assert "Translation processing failed" in str(exc_info.value)
+    assert "Translation processing failed" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
-async def test_llm_translation_client_invalid_json(sample_regions):
+async def test_llm_translation_client_invalid_json(sample_regions, mock_openai):
     """Test translation client handles invalid JSON response."""
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock(message=MagicMock(content="not json"))]
-
-    with patch("app.clients.translation_client.AsyncOpenAI") as mock_openai:
-        mock_client = MagicMock()
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        mock_openai.return_value = mock_client
+    mock_openai.return_value.chat.completions.create.return_value = _openai_response("not json")
 
-        client = LlmTranslationClient(api_key="test-key")
-        with pytest.raises(Exception) as exc_info:
-            await client.translate_text_regions(sample_regions, "fr-FR")
+    client = LlmTranslationClient(api_key="test-key")
+    with pytest.raises(Exception) as exc_info:
+        await client.translate_text_regions(sample_regions, "fr-FR")
 
-        assert "Invalid response format" in str(exc_info.value)
+    assert "Invalid response format" in str(exc_info.value)
 
 
 def test_llm_translation_client_missing_api_key():
@@ -98,44 +176,36 @@ def test_llm_translation_client_missing_api_key():
 
 
 @pytest.mark.asyncio
-async def test_llm_translation_client_no_nameerror_on_exception(sample_regions):
+async def test_llm_translation_client_no_nameerror_on_exception(sample_regions, mock_openai):
     """Test that translation client doesn't raise NameError/UnboundLocalError on exceptions.
 
     This test ensures correlation_str and content are always defined before use in except blocks.
     """
-    with patch("app.clients.translation_client.AsyncOpenAI") as mock_openai:
-        mock_client = MagicMock()
-        # Simulate an exception during API call
-        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("Network error"))
-        mock_openai.return_value = mock_client
+    # Simulate an exception during API call
+    mock_openai.return_value.chat.completions.create.side_effect = Exception("Network error")
 
-        client = LlmTranslationClient(api_key="test-key", model="gpt-4o-mini")
+    client = LlmTranslationClient(api_key="test-key", model="gpt-4o-mini")
 
-        # Should raise Exception but NOT NameError or UnboundLocalError
-        with pytest.raises(Exception) as exc_info:
-            await client.translate_text_regions(sample_regions, "fr-FR", job_id="test_job_123")
+    # Should raise Exception but NOT NameError or UnboundLocalError
+    with pytest.raises(Exception) as exc_info:
+        await client.translate_text_regions(sample_regions, "fr-FR", job_id="test_job_123")
 
-        # Verify it's our wrapped exception, not a NameError
-        assert "Translation processing failed" in str(exc_info.value)
-        assert not isinstance(exc_info.value, NameError)
-        assert not isinstance(exc_info.value, UnboundLocalError)
+    # Verify it's our wrapped exception, not a NameError
+    assert "Translation processing failed" in str(exc_info.value)
+    assert not isinstance(exc_info.value, NameError)
+    assert not isinstance(exc_info.value, UnboundLocalError)
 
 
 @pytest.mark.asyncio
-async def test_llm_translation_client_logs_service_response_on_success(sample_regions, mock_openai_response, caplog):
+async def test_llm_translation_client_logs_service_response_on_success(sample_regions, mock_openai, caplog):
     """Test that translation client logs ServiceResponse on success."""
-    with patch("app.clients.translation_client.AsyncOpenAI") as mock_openai:
-        mock_client = MagicMock()
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
-        mock_openai.return_value = mock_client
-
-        client = LlmTranslationClient(api_key="test-key")
-        await client.translate_text_regions(sample_regions, "fr-FR", job_id="test_job_123")
-
-        # Verify ServiceResponse log was emitted
-        log_messages = [record.message for record in caplog.records]
-        service_response_logs = [msg for msg in log_messages if "ServiceResponse" in msg and "TRANSLATION" in msg]
-        assert len(service_response_logs) > 0
-        assert any("status=200" in msg for msg in service_response_logs)
-        assert any("durationMs=" in msg for msg in service_response_logs)
-        assert any("responseSizeBytes=" in msg for msg in service_response_logs)
+    client = LlmTranslationClient(api_key="test-key")
+    await client.translate_text_regions(sample_regions, "fr-FR", job_id="test_job_123")
+
+    # Verify ServiceResponse log was emitted
+    log_messages = [record.message for record in caplog.records]
+    service_response_logs = [msg for msg in log_messages if "ServiceResponse" in msg and "TRANSLATION" in msg]
+    assert len(service_response_logs) > 0
+    assert any("status=200" in msg for msg in service_response_logs)
+    assert any("durationMs=" in msg for msg in service_response_logs)
+    assert any("responseSizeBytes=" in msg for msg in service_response_logs)